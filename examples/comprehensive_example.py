@@ -17,109 +17,346 @@ This script shows how to:
 12. Get torikumi (match schedule)
 """
 
+import argparse
 import asyncio
 import sys
-from typing import Dict, List
+import traceback
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from itertools import groupby, islice
+from operator import attrgetter
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 import httpx
 
 from pysumoapi.client import SumoClient
-from pysumoapi.models.ranks import Rank
-from pysumoapi.models.shikonas import Shikona
+from pysumoapi.models import (
+    Banzuke,
+    Basho,
+    KimariteMatchesResponse,
+    KimariteResponse,
+    Measurement,
+    Rank,
+    Rikishi,
+    RikishiList,
+    RikishiMatchesResponse,
+    RikishiOpponentMatchesResponse,
+    RikishiStats,
+    Shikona,
+    Torikumi,
+)
 
+# Request and display constants shared across the helpers
+_ASC: Final = "asc"
+_DESC: Final = "desc"
+_MAKUUCHI: Final = "Makuuchi"
+_REPORTED_DIVISIONS: Final = (_MAKUUCHI, "Juryo", "Makushita", "Sandanme")
 
-async def get_rikishi_career_summary(client: SumoClient, rikishi_id: int) -> dict:
-    """Get a comprehensive career summary for a rikishi."""
-    # Get basic rikishi info
-    rikishi = await client.get_rikishi(rikishi_id)
+# Line templates for the history and match listings, bound once at import
+_format_match = "Basho {} Day {}: {} vs {} - Winner: {}".format
+_format_shikona = "Basho: {}, Shikona: {}".format
+_format_rank = "Basho: {}, Rank: {}".format
+_format_measurement = "Basho: {}\n  Height: {}cm\n  Weight: {}kg".format
+
+# Upper bound on the number of rikishi kept by get_rikishi_cached
+_RIKISHI_CACHE_SIZE: Final = 512
+
+# On-disk response cache. Career data changes at most once per basho, so an
+# hour-long TTL lets reruns skip the network without serving stale records.
+_CACHE_DIR: Final = Path.home() / ".cache" / "pysumoapi"
+_CACHE_TTL: Final = 3600.0
+
+
+# Result carriers. Explicit __slots__ keeps instances small and attribute
+# access fast; dataclass(slots=True) would need Python 3.10+.
+@dataclass(frozen=True)
+class CareerSummary:
+    """Data gathered for a rikishi's career."""
+
+    __slots__ = ("measurements", "ranks", "rikishi", "shikonas", "stats")
+
+    rikishi: Rikishi
+    stats: RikishiStats
+    shikonas: List[Shikona]
+    measurements: Optional[List[Measurement]]  # None if the lookup failed
+    ranks: Optional[List[Rank]]  # None if the lookup failed
+
+
+@dataclass(frozen=True)
+class KimariteAnalysis:
+    """Kimarite statistics and, optionally, recent matches using one kimarite."""
+
+    __slots__ = ("matches", "stats")
+
+    stats: KimariteResponse
+    matches: Optional[KimariteMatchesResponse]
+
+
+@dataclass(frozen=True)
+class MatchesAnalysis:
+    """A rikishi's matches and, optionally, their record against one opponent."""
+
+    __slots__ = ("matches", "opponent_matches")
+
+    matches: RikishiMatchesResponse
+    opponent_matches: Optional[RikishiOpponentMatchesResponse]
+
+
+@dataclass(frozen=True)
+class BashoDetails:
+    """Basho details with its Makuuchi banzuke and day 1 torikumi."""
 
-    # Get rikishi stats
-    stats = await client.get_rikishi_stats(rikishi_id)
+    __slots__ = ("banzuke", "basho", "torikumi")
 
-    # Get shikona history
-    shikonas = await client.get_shikonas(rikishi_id=rikishi_id, sort_order="asc")
+    basho: Basho
+    banzuke: Banzuke
+    torikumi: Torikumi
 
-    # Get measurements history
-    measurements = await client.get_measurements(
-        rikishi_id=rikishi_id, sort_order="asc"
+
+@dataclass(frozen=True)
+class RikishiSearch:
+    """Results of a rikishi search."""
+
+    __slots__ = ("rikishis",)
+
+    rikishis: RikishiList
+
+
+@dataclass(frozen=True)
+class CareerAnalysis:
+    """Analysis of a rikishi's career progression."""
+
+    __slots__ = (
+        "career_duration",
+        "current_shikona",
+        "first_basho",
+        "first_rank",
+        "first_shikona",
+        "last_basho",
+        "last_rank",
+        "rank_progression",
+        "shikona_changes",
     )
 
-    # Get rank history
-    ranks = await client.get_ranks(rikishi_id=rikishi_id, sort_order="asc")
+    first_basho: str
+    last_basho: str
+    career_duration: str
+    first_rank: str
+    last_rank: str
+    rank_progression: List[Tuple[str, str]]  # (basho_id, rank)
+    shikona_changes: List[Tuple[str, str]]  # (basho_id, shikona)
+    first_shikona: Optional[str]
+    current_shikona: Optional[str]
 
-    return {
-        "rikishi": rikishi,
-        "stats": stats,
-        "shikonas": shikonas,
-        "measurements": measurements,
-        "ranks": ranks,
-    }
 
+async def batch_fetch(
+    calls: List[Callable[[], Awaitable[Any]]], concurrency: int = 16
+) -> List[Any]:
+    """
+    Run a batch of API calls concurrently.
 
-async def get_kimarite_analysis(client: SumoClient, kimarite: str = None) -> dict:
-    """Get kimarite statistics and recent matches."""
-    # Get general kimarite statistics
-    kimarite_stats = await client.get_kimarite(
-        sort_field="count", sort_order="desc", limit=10
+    Args:
+        calls: Zero-argument callables that each return an awaitable API call
+        concurrency: Maximum number of calls in flight at once
+
+    Returns:
+        Results in the same order as ``calls``; a failed call yields its exception
+        instead of aborting the rest of the batch
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+
+def raise_first_error(results: List[Any]) -> None:
+    """Re-raise the first exception captured by ``batch_fetch``, if any."""
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def fetch_all(*calls: Awaitable[Any]) -> List[Any]:
+    """
+    Await API calls concurrently, cancelling the others as soon as one fails.
+
+    This gives the structured cancellation of ``asyncio.TaskGroup`` (Python
+    3.11+) on every supported Python version.
+
+    Args:
+        *calls: Awaitable API calls
+
+    Returns:
+        Results in the same order as ``calls``
+    """
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancellations so no task outlives this call
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+_rikishi_cache: "OrderedDict[Tuple[str, int], Rikishi]" = OrderedDict()
+_rikishi_pending: "Dict[Tuple[str, int], asyncio.Future[Rikishi]]" = {}
+
+
+def _store_rikishi(key: Tuple[str, int], task: "asyncio.Future[Rikishi]") -> None:
+    """Move a finished lookup from the in-flight table into the LRU."""
+    del _rikishi_pending[key]
+    if task.cancelled() or task.exception() is not None:
+        return
+    _rikishi_cache[key] = task.result()
+    if len(_rikishi_cache) > _RIKISHI_CACHE_SIZE:
+        _rikishi_cache.popitem(last=False)
+
+
+async def fetch_optional(call: Awaitable[Any]) -> Optional[Any]:
+    """
+    Await an API call whose failure should not abort the calls around it.
+
+    Args:
+        call: Awaitable API call
+
+    Returns:
+        The call's result, or None if the API rejected or failed the request
+    """
+    try:
+        return await call
+    except (ValueError, httpx.HTTPStatusError):
+        return None
+
+
+async def get_rikishi_cached(client: SumoClient, rikishi_id: int) -> Rikishi:
+    """
+    Get a rikishi, reusing earlier lookups of the same ID.
+
+    Parsed models are kept in a bounded LRU keyed on the API base URL and ID,
+    so a repeat lookup costs neither a request nor a validation. Concurrent
+    lookups of an ID that is not cached yet share a single request.
+
+    Args:
+        client: Open SumoClient
+        rikishi_id: The ID of the rikishi
+
+    Returns:
+        The rikishi
+    """
+    # IDs are ints throughout this example, so they key the cache as-is
+    key = (client.base_url, rikishi_id)
+    rikishi = _rikishi_cache.get(key)
+    if rikishi is not None:
+        _rikishi_cache.move_to_end(key)
+        return rikishi
+
+    task = _rikishi_pending.get(key)
+    if task is None:
+        task = asyncio.ensure_future(client.get_rikishi(rikishi_id))
+        _rikishi_pending[key] = task
+        task.add_done_callback(lambda done: _store_rikishi(key, done))
+    # Shield the shared request so one cancelled caller does not fail the rest
+    return await asyncio.shield(task)
+
+
+async def get_rikishi_career_summary(
+    client: SumoClient, rikishi_id: int
+) -> CareerSummary:
+    """Get a comprehensive career summary for a rikishi."""
+    # The five lookups are independent, so issue them concurrently. The
+    # summary cannot be built without the first three, so a failure there
+    # cancels the rest; missing measurement or rank history only leaves
+    # that part of the summary empty.
+    results = await fetch_all(
+        get_rikishi_cached(client, rikishi_id),
+        client.get_rikishi_stats(rikishi_id),
+        client.get_shikonas(rikishi_id=rikishi_id, sort_order=_ASC),
+        fetch_optional(
+            client.get_measurements(rikishi_id=rikishi_id, sort_order=_ASC)
+        ),
+        fetch_optional(client.get_ranks(rikishi_id=rikishi_id, sort_order=_ASC)),
     )
+    return CareerSummary(*results)
 
-    # If a specific kimarite is provided, get recent matches using it
-    kimarite_matches = None
+
+async def get_kimarite_analysis(
+    client: SumoClient, kimarite: str = None
+) -> KimariteAnalysis:
+    """Get kimarite statistics and recent matches."""
+    # General kimarite statistics
+    calls = [client.get_kimarite(sort_field="count", sort_order=_DESC, limit=10)]
+
+    # If a specific kimarite is provided, fetch recent matches using it in the
+    # same round trip as the statistics
     if kimarite:
-        kimarite_matches = await client.get_kimarite_matches(
-            kimarite=kimarite, sort_order="desc", limit=5
+        calls.append(
+            client.get_kimarite_matches(kimarite=kimarite, sort_order=_DESC, limit=5)
         )
 
-    return {
-        "stats": kimarite_stats,
-        "matches": kimarite_matches,
-    }
+    results = await fetch_all(*calls)
+    kimarite_matches = results[1] if kimarite else None
+    return KimariteAnalysis(stats=results[0], matches=kimarite_matches)
 
 
-async def get_rikishi_matches_analysis(client: SumoClient, rikishi_id: int, opponent_id: int = None) -> dict:
+async def get_rikishi_matches_analysis(
+    client: SumoClient, rikishi_id: int, opponent_id: int = None
+) -> MatchesAnalysis:
     """Get matches for a rikishi and optionally against a specific opponent."""
-    # Get all matches for the rikishi
-    matches = await client.get_rikishi_matches(rikishi_id=rikishi_id)
-    
-    # If an opponent is specified, get matches between the two rikishi
-    opponent_matches = None
+    # All matches for the rikishi
+    calls = [client.get_rikishi_matches(rikishi_id=rikishi_id)]
+
+    # Head-to-head matches only depend on the IDs, so fetch them alongside
     if opponent_id:
-        opponent_matches = await client.get_rikishi_opponent_matches(
-            rikishi_id=rikishi_id,
-            opponent_id=opponent_id
+        calls.append(
+            client.get_rikishi_opponent_matches(
+                rikishi_id=rikishi_id, opponent_id=opponent_id
+            )
         )
-    
-    return {
-        "matches": matches,
-        "opponent_matches": opponent_matches
-    }
+
+    results = await fetch_all(*calls)
+    opponent_matches = results[1] if opponent_id else None
+    return MatchesAnalysis(matches=results[0], opponent_matches=opponent_matches)
 
 
-async def get_basho_details(client: SumoClient, basho_id: str) -> dict:
+async def get_basho_details(client: SumoClient, basho_id: str) -> BashoDetails:
     """Get comprehensive details about a basho tournament."""
-    try:
-        # Get basic basho info
-        basho = await client.get_basho(basho_id)
-        
-        # Get banzuke for Makuuchi division
-        banzuke = await client.get_banzuke(basho_id=basho_id, division="Makuuchi")
-        
-        # Get torikumi for day 1
-        torikumi = await client.get_torikumi(basho_id=basho_id, division="Makuuchi", day=1)
-        
-        return {
-            "basho": basho,
-            "banzuke": banzuke,
-            "torikumi": torikumi
-        }
-    except Exception as e:
-        print(f"Error in get_basho_details: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
+    # Basho info, Makuuchi banzuke and day 1 torikumi are independent, so they
+    # are in flight together over the client's HTTP/2 connection
+    results = await batch_fetch(
+        [
+            lambda: client.get_basho(basho_id),
+            lambda: client.get_banzuke(basho_id=basho_id, division=_MAKUUCHI),
+            lambda: client.get_torikumi(basho_id=basho_id, division=_MAKUUCHI, day=1),
+        ]
+    )
+
+    # Report every failed request, not just the first, before re-raising
+    errors = [result for result in results if isinstance(result, Exception)]
+    for error in errors:
+        print(f"Error in get_basho_details: {error}")
+        traceback.print_exception(type(error), error, error.__traceback__)
+    raise_first_error(results)
 
+    return BashoDetails(*results)
 
-async def search_rikishi(client: SumoClient, heya: str = None) -> dict:
+
+async def search_rikishi(client: SumoClient, heya: str = None) -> RikishiSearch:
     """Search for rikishi using various filters."""
     # Get list of rikishi from a specific heya
     rikishis = await client.get_rikishis(
@@ -130,201 +367,361 @@ async def search_rikishi(client: SumoClient, heya: str = None) -> dict:
         limit=5
     )
     
-    return {
-        "rikishis": rikishis
-    }
+    return RikishiSearch(rikishis=rikishis)
+
 
+def parse_basho_id(basho_id: str) -> Tuple[int, int]:
+    """Split a basho ID in YYYYMM format into (year, month)."""
+    return divmod(int(basho_id), 100)
 
-def analyze_career_progression(ranks: List[Rank], shikonas: List[Shikona]) -> Dict:
+
+def scan_changes(
+    records: Iterable[Any], field: str
+) -> Tuple[Optional[Any], Optional[Any], List[Tuple[str, Any]]]:
     """
-    Analyze a rikishi's career progression based on rank and shikona changes.
+    Find the first and last records and the basho where a field changes value.
+
+    Each run of identical values is collapsed into its first record. The
+    records are traversed exactly once, so any iterable (including a
+    stream) can be passed.
 
     Args:
-        ranks: List of Rank objects
-        shikonas: List of Shikona objects
+        records: Records with a ``basho_id`` attribute, sorted by basho
+        field: Name of the attribute to track
 
     Returns:
-        Dictionary containing career analysis
+        Tuple of (first record, last record, list of (basho_id, value) changes);
+        the records are None when ``records`` is empty
+    """
+    first = last = None
+    changes = []
+    for value, group in groupby(records, key=attrgetter(field)):
+        head = next(group)
+        if first is None:
+            first = head
+        changes.append((head.basho_id, value))
+        # Drain the rest of the run at C speed, keeping only its final record
+        tail = deque(group, maxlen=1)
+        last = tail[0] if tail else head
+    return first, last, changes
+
+
+def analyze_career_progression(
+    ranks: Optional[Iterable[Rank]], shikonas: Optional[Iterable[Shikona]]
+) -> Optional[CareerAnalysis]:
     """
-    if not ranks:
-        return {"error": "No rank data available"}
+    Analyze a rikishi's career progression based on rank and shikona changes.
 
-    # Get first and last rank
-    first_rank = ranks[0]
-    last_rank = ranks[-1]
+    Args:
+        ranks: Rank objects sorted by basho, or None if unavailable
+        shikonas: Shikona objects sorted by basho, or None if unavailable
 
-    # Get first and last shikona
-    first_shikona = shikonas[0] if shikonas else None
-    last_shikona = shikonas[-1] if shikonas else None
+    Returns:
+        CareerAnalysis for the career, or None if there is no rank data
+    """
+    # One pass over each sequence yields its endpoints and its changes
+    first_rank, last_rank, rank_progression = scan_changes(ranks or (), "rank")
+    if first_rank is None:
+        return None
+    first_shikona, last_shikona, shikona_changes = scan_changes(
+        shikonas or (), "shikona_en"
+    )
 
     # Calculate career duration
     first_basho = first_rank.basho_id
     last_basho = last_rank.basho_id
 
     # Convert basho IDs to years (YYYYMM format)
-    first_year = int(first_basho[:4])
-    first_month = int(first_basho[4:])
-    last_year = int(last_basho[:4])
-    last_month = int(last_basho[4:])
-
-    # Calculate years and months
-    years = last_year - first_year
-    months = last_month - first_month
+    first_year, first_month = parse_basho_id(first_basho)
+    last_year, last_month = parse_basho_id(last_basho)
 
-    if months < 0:
-        years -= 1
-        months += 12
+    # Calculate years and months from the total month span
+    years, months = divmod(
+        (last_year * 12 + last_month) - (first_year * 12 + first_month), 12
+    )
 
-    # Format career duration
+    # Format career duration, joining the parts once
+    parts = []
     if years > 0:
-        duration = f"{years} year{'s' if years != 1 else ''}"
-        if months > 0:
-            duration += f" and {months} month{'s' if months != 1 else ''}"
-    else:
-        duration = f"{months} month{'s' if months != 1 else ''}"
-
-    # Analyze rank progression
-    rank_progression = []
-    current_rank = None
-
-    for rank in ranks:
-        if rank.rank != current_rank:
-            rank_progression.append({"basho": rank.basho_id, "rank": rank.rank})
-            current_rank = rank.rank
+        parts.append(f"{years} year{'s' if years != 1 else ''}")
+    if months > 0 or years <= 0:
+        parts.append(f"{months} month{'s' if months != 1 else ''}")
+    duration = " and ".join(parts)
+
+    return CareerAnalysis(
+        first_basho=first_basho,
+        last_basho=last_basho,
+        career_duration=duration,
+        first_rank=first_rank.rank,
+        last_rank=last_rank.rank,
+        rank_progression=rank_progression,
+        shikona_changes=shikona_changes,
+        first_shikona=first_shikona.shikona_en if first_shikona else None,
+        current_shikona=last_shikona.shikona_en if last_shikona else None,
+    )
 
-    # Analyze shikona changes
-    shikona_changes = []
-    current_shikona = None
 
-    for shikona in shikonas:
-        if shikona.shikona_en != current_shikona:
-            shikona_changes.append(
-                {"basho": shikona.basho_id, "shikona": shikona.shikona_en}
-            )
-            current_shikona = shikona.shikona_en
-
-    return {
-        "first_basho": first_basho,
-        "last_basho": last_basho,
-        "career_duration": duration,
-        "first_rank": first_rank.rank,
-        "last_rank": last_rank.rank,
-        "rank_progression": rank_progression,
-        "shikona_changes": shikona_changes,
-        "first_shikona": first_shikona.shikona_en if first_shikona else None,
-        "current_shikona": last_shikona.shikona_en if last_shikona else None,
-    }
-
-
-def display_career_summary(rikishi_id: int, analysis: Dict) -> None:
+def display_career_summary(
+    rikishi_id: int, analysis: Optional[CareerAnalysis]
+) -> None:
     """
     Display a summary of a rikishi's career.
 
     Args:
         rikishi_id: The ID of the rikishi
-        analysis: Dictionary containing career analysis
+        analysis: Career analysis, or None if no rank data was available
     """
-    print(f"\nCareer Summary for Rikishi ID {rikishi_id}")
-    print("=" * 50)
+    # Collect output lines and write them in one call rather than per line
+    out = [f"\nCareer Summary for Rikishi ID {rikishi_id}", "=" * 50]
 
-    if "error" in analysis:
-        print(f"Error: {analysis['error']}")
+    if analysis is None:
+        out.append("Error: No rank data available")
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
-    print(f"Career Duration: {analysis['career_duration']}")
-    print(f"First Basho: {analysis['first_basho']}")
-    print(f"Last Basho: {analysis['last_basho']}")
-    print(f"First Rank: {analysis['first_rank']}")
-    print(f"Current Rank: {analysis['last_rank']}")
+    out.append(f"Career Duration: {analysis.career_duration}")
+    out.append(f"First Basho: {analysis.first_basho}")
+    out.append(f"Last Basho: {analysis.last_basho}")
+    out.append(f"First Rank: {analysis.first_rank}")
+    out.append(f"Current Rank: {analysis.last_rank}")
 
-    if analysis["first_shikona"]:
-        print(f"First Shikona: {analysis['first_shikona']}")
-        print(f"Current Shikona: {analysis['current_shikona']}")
+    if analysis.first_shikona:
+        out.append(f"First Shikona: {analysis.first_shikona}")
+        out.append(f"Current Shikona: {analysis.current_shikona}")
 
-    print("\nRank Progression:")
-    print("-" * 30)
-    for rank_change in analysis["rank_progression"]:
-        print(f"Basho {rank_change['basho']}: {rank_change['rank']}")
+    out.append("\nRank Progression:")
+    out.append("-" * 30)
+    for basho, rank in analysis.rank_progression:
+        out.append(f"Basho {basho}: {rank}")
 
-    if analysis["shikona_changes"]:
-        print("\nShikona Changes:")
-        print("-" * 30)
-        for shikona_change in analysis["shikona_changes"]:
-            print(f"Basho {shikona_change['basho']}: {shikona_change['shikona']}")
+    if analysis.shikona_changes:
+        out.append("\nShikona Changes:")
+        out.append("-" * 30)
+        for basho, shikona in analysis.shikona_changes:
+            out.append(f"Basho {basho}: {shikona}")
 
+    sys.stdout.write("\n".join(out) + "\n")
 
-def display_kimarite_analysis(analysis: Dict, kimarite: str = None) -> None:
+
+def display_kimarite_analysis(analysis: KimariteAnalysis, kimarite: str = None) -> None:
     """Display kimarite statistics and matches."""
-    print("\nKimarite Statistics (Top 10):")
-    for stat in analysis["stats"].records:
-        print(f"{stat.kimarite}: {stat.count} times")
+    out = ["\nKimarite Statistics (Top 10):"]
+    for stat in analysis.stats.records:
+        out.append(f"{stat.kimarite}: {stat.count} times")
+
+    if kimarite and analysis.matches:
+        out.append(f"\nRecent Matches using {kimarite}:")
+        for match in analysis.matches.records:
+            out.append(
+                _format_match(
+                    match.basho_id,
+                    match.day,
+                    match.east_shikona,
+                    match.west_shikona,
+                    match.winner_en,
+                )
+            )
 
-    if kimarite and analysis["matches"]:
-        print(f"\nRecent Matches using {kimarite}:")
-        for match in analysis["matches"].records:
-            print(f"Basho {match.basho_id} Day {match.day}: {match.east_shikona} vs {match.west_shikona} - Winner: {match.winner_en}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def display_matches_analysis(analysis: Dict, opponent_id: int = None) -> None:
+def display_matches_analysis(analysis: MatchesAnalysis, opponent_id: int = None) -> None:
     """Display rikishi matches and opponent matches if available."""
-    print("\nRecent Matches:")
-    for match in analysis["matches"].records[:5]:  # Show last 5 matches
-        print(f"Basho {match.basho_id} Day {match.day}: {match.east_shikona} vs {match.west_shikona} - Winner: {match.winner_en}")
-    
-    if opponent_id and analysis["opponent_matches"]:
-        print(f"\nMatches against Rikishi {opponent_id}:")
-        for match in analysis["opponent_matches"].matches:  # Changed from records to matches
-            try:
-                # Handle potential missing fields
-                basho_id = getattr(match, "basho_id", "Unknown")
-                day = getattr(match, "day", 0)
-                east_shikona = getattr(match, "east_shikona", "Unknown")
-                west_shikona = getattr(match, "west_shikona", "Unknown")
-                winner_en = getattr(match, "winner_en", "Unknown")
-                
-                print(f"Basho {basho_id} Day {day}: {east_shikona} vs {west_shikona} - Winner: {winner_en}")
-            except Exception as e:
-                print(f"Error displaying match: {e}")
-                # Print raw match data for debugging
-                print(f"Match data: {match}")
-
-
-def display_basho_details(analysis: Dict) -> None:
-    """Display comprehensive basho tournament details."""
-    basho = analysis["basho"]
-    print(f"\nBasho Tournament: {basho.date}")
-    print(f"Location: {basho.location}")
-    print(f"Start Date: {basho.start_date}")
-    print(f"End Date: {basho.end_date}")
-    
-    print("\nMakuuchi Banzuke:")
-    print("East Side:")
-    for rikishi in analysis["banzuke"].east:
-        print(f"{rikishi.rank}: {rikishi.shikona_en}")
-    print("\nWest Side:")
-    for rikishi in analysis["banzuke"].west:
-        print(f"{rikishi.rank}: {rikishi.shikona_en}")
-    
-    print("\nDay 1 Torikumi:")
-    for match in analysis["torikumi"].matches:
-        print(f"Match {match.match_no}: {match.east_shikona} vs {match.west_shikona}")
+    out = ["\nRecent Matches:"]
+    # Show the last 5 matches without copying the record list
+    for match in islice(analysis.matches.records, 5):
+        out.append(
+            _format_match(
+                match.basho_id,
+                match.day,
+                match.east_shikona,
+                match.west_shikona,
+                match.winner_en,
+            )
+        )
 
+    if opponent_id and analysis.opponent_matches:
+        out.append(f"\nMatches against Rikishi {opponent_id}:")
+        # Match is a pydantic model, so every field is declared (optional
+        # ones default to None) and can be read directly
+        for match in analysis.opponent_matches.matches:
+            out.append(
+                _format_match(
+                    match.basho_id,
+                    match.day,
+                    match.east_shikona,
+                    match.west_shikona,
+                    match.winner_en,
+                )
+            )
 
-def display_rikishi_search(analysis: Dict) -> None:
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def display_basho_details(analysis: BashoDetails) -> None:
+    """Display comprehensive basho tournament details."""
+    basho = analysis.basho
+    out = [
+        f"\nBasho Tournament: {basho.date}",
+        f"Location: {basho.location}",
+        f"Start Date: {basho.start_date}",
+        f"End Date: {basho.end_date}",
+    ]
+
+    out.append("\nMakuuchi Banzuke:")
+    out.append("East Side:")
+    for rikishi in analysis.banzuke.east:
+        out.append(f"{rikishi.rank}: {rikishi.shikona_en}")
+    out.append("\nWest Side:")
+    for rikishi in analysis.banzuke.west:
+        out.append(f"{rikishi.rank}: {rikishi.shikona_en}")
+
+    out.append("\nDay 1 Torikumi:")
+    for match in analysis.torikumi.matches:
+        out.append(f"Match {match.match_no}: {match.east_shikona} vs {match.west_shikona}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def display_rikishi_search(analysis: RikishiSearch) -> None:
     """Display results of rikishi search."""
-    print("\nSearch Results:")
-    for rikishi in analysis["rikishis"].records:
-        print(f"\nRikishi ID: {rikishi.id}")
-        print(f"Name: {rikishi.shikona_en}")
-        print(f"Heya: {rikishi.heya}")
+    out = ["\nSearch Results:"]
+    for rikishi in analysis.rikishis.records:
+        out.append(f"\nRikishi ID: {rikishi.id}")
+        out.append(f"Name: {rikishi.shikona_en}")
+        out.append(f"Heya: {rikishi.heya}")
         # Rikishi model has direct height and weight fields, not a nested measurements object
-        print(f"Height: {rikishi.height}cm")
-        print(f"Weight: {rikishi.weight}kg")
+        out.append(f"Height: {rikishi.height}cm")
+        out.append(f"Weight: {rikishi.weight}kg")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def display_rikishi_profile(summary: CareerSummary) -> None:
+    """Display rikishi information, career statistics and history."""
+    rikishi = summary.rikishi
+    out = [
+        "\nRikishi Information:",
+        f"Name: {rikishi.shikona_en}",
+        f"Heya: {rikishi.heya}",
+        f"Birth Date: {rikishi.birth_date.strftime('%Y-%m-%d')}",
+        f"Height: {rikishi.height}cm",
+        f"Weight: {rikishi.weight}kg",
+    ]
+
+    # Career stats
+    stats = summary.stats
+    out.append("\nCareer Statistics:")
+    out.append(f"Total Basho: {stats.basho}")
+    out.append(f"Total Matches: {stats.total_matches}")
+    out.append(f"Wins: {stats.total_wins}")
+    out.append(f"Losses: {stats.total_losses}")
+    out.append(f"Absences: {stats.total_absences}")
+    out.append(f"Win Rate: {stats.total_wins / stats.total_matches:.2%}")
+    out.append(f"Yusho: {stats.yusho}")
+
+    # Division stats; dump each breakdown once and read plain dicts
+    out.append("\nDivision Statistics:")
+    totals = stats.total_by_division.model_dump()
+    wins = stats.wins_by_division.model_dump()
+    losses = stats.loss_by_division.model_dump()
+    absences = stats.absence_by_division.model_dump()
+    yusho = stats.yusho_by_division.model_dump()
+    for division in _REPORTED_DIVISIONS:
+        if division in totals:
+            out.append(f"\n{division}:")
+            out.append(f"  Total Matches: {totals[division]}")
+            out.append(f"  Wins: {wins[division]}")
+            out.append(f"  Losses: {losses[division]}")
+            out.append(f"  Absences: {absences[division]}")
+            out.append(f"  Yusho: {yusho[division]}")
+
+    # Special prizes
+    out.append("\nSpecial Prizes:")
+    out.append(f"Gino-sho: {stats.sansho.Gino_sho}")
+    out.append(f"Kanto-sho: {stats.sansho.Kanto_sho}")
+    out.append(f"Shukun-sho: {stats.sansho.Shukun_sho}")
+
+    # Shikona history
+    out.append("\nShikona History:")
+    for shikona in summary.shikonas:
+        out.append(_format_shikona(shikona.basho_id, shikona.shikona_en))
+
+    # Measurements history
+    out.append("\nMeasurements History:")
+    if summary.measurements is None:
+        out.append("Not available")
+    else:
+        for measurement in summary.measurements:
+            out.append(
+                _format_measurement(
+                    measurement.basho_id, measurement.height, measurement.weight
+                )
+            )
+
+    # Rank history
+    out.append("\nRank History:")
+    if summary.ranks is None:
+        out.append("Not available")
+    else:
+        for rank in summary.ranks:
+            out.append(_format_rank(rank.basho_id, rank.rank))
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-async def main():
+class _ClientHolder:
+    """Holds the SumoClient shared by every call in this example.
+
+    The client is created on first use and is persistent, so its connection
+    pool (and TLS sessions) stay warm across repeated ``main()`` calls until
+    ``aclose()`` is called.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[SumoClient] = None
+
+    def get_client(self, use_cache: bool = True) -> SumoClient:
+        """Return the shared client, creating it on first use.
+
+        Args:
+            use_cache: Whether to cache responses on disk between runs; only
+                read when the client is first created
+        """
+        if self._client is None:
+            # Cache responses on disk so repeated runs avoid refetching
+            # unchanged data, and cap concurrent requests so fan-out cannot
+            # flood the API. HTTP/2 multiplexes the concurrent fetches over
+            # one connection; the pool limits are spelled out so they are
+            # easy to tune.
+            self._client = SumoClient.persistent(
+                cache_dir=_CACHE_DIR if use_cache else None,
+                cache_ttl=_CACHE_TTL,
+                max_concurrency=16,
+                enable_http2=True,
+                max_connections=100,
+                max_keepalive_connections=20,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client if it was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_clients = _ClientHolder()
+get_client = _clients.get_client
+close_client = _clients.aclose
+
+
+async def main(use_cache: bool = True):
     """Example usage of multiple endpoints."""
-    async with SumoClient() as client:
+    client = get_client(use_cache)
+    # The persistent client is opened on the first call and left open by
+    # later calls, so repeated runs reuse its connections
+    async with client:
         try:
             # Example rikishi IDs
             rikishi_id = 1511  # Example rikishi ID
@@ -335,77 +732,33 @@ async def main():
             # Get career summary for a specific rikishi
             summary = await get_rikishi_career_summary(client, rikishi_id)
 
-            # Print basic info
-            rikishi = summary["rikishi"]
-            print("\nRikishi Information:")
-            print(f"Name: {rikishi.shikona_en}")
-            print(f"Heya: {rikishi.heya}")
-            print(f"Birth Date: {rikishi.birth_date.strftime('%Y-%m-%d')}")
-            print(f"Height: {rikishi.height}cm")
-            print(f"Weight: {rikishi.weight}kg")
-
-            # Print career stats
-            stats = summary["stats"]
-            print("\nCareer Statistics:")
-            print(f"Total Basho: {stats.basho}")
-            print(f"Total Matches: {stats.total_matches}")
-            print(f"Wins: {stats.total_wins}")
-            print(f"Losses: {stats.total_losses}")
-            print(f"Absences: {stats.total_absences}")
-            print(f"Win Rate: {stats.total_wins / stats.total_matches:.2%}")
-            print(f"Yusho: {stats.yusho}")
-
-            # Print division stats
-            print("\nDivision Statistics:")
-            for division in ["Makuuchi", "Juryo", "Makushita", "Sandanme"]:
-                if hasattr(stats.total_by_division, division):
-                    print(f"\n{division}:")
-                    print(
-                        f"  Total Matches: {getattr(stats.total_by_division, division)}"
-                    )
-                    print(f"  Wins: {getattr(stats.wins_by_division, division)}")
-                    print(f"  Losses: {getattr(stats.loss_by_division, division)}")
-                    print(f"  Absences: {getattr(stats.absence_by_division, division)}")
-                    print(f"  Yusho: {getattr(stats.yusho_by_division, division)}")
-
-            # Print special prizes
-            print("\nSpecial Prizes:")
-            print(f"Gino-sho: {stats.sansho.Gino_sho}")
-            print(f"Kanto-sho: {stats.sansho.Kanto_sho}")
-            print(f"Shukun-sho: {stats.sansho.Shukun_sho}")
-
-            # Print shikona history
-            print("\nShikona History:")
-            for shikona in summary["shikonas"]:
-                print(f"Basho: {shikona.basho_id}, Shikona: {shikona.shikona_en}")
-
-            # Print measurements history
-            print("\nMeasurements History:")
-            for measurement in summary["measurements"]:
-                print(f"Basho: {measurement.basho_id}")
-                print(f"  Height: {measurement.height}cm")
-                print(f"  Weight: {measurement.weight}kg")
-
-            # Print rank history
-            print("\nRank History:")
-            for rank in summary["ranks"]:
-                print(f"Basho: {rank.basho_id}, Rank: {rank.rank}")
-
-            # Get and display kimarite analysis
-            kimarite_analysis = await get_kimarite_analysis(client, "yorikiri")
-            display_kimarite_analysis(kimarite_analysis, "yorikiri")
-
-            # Get and display matches analysis
-            matches_analysis = await get_rikishi_matches_analysis(client, rikishi_id, opponent_id)
-            display_matches_analysis(matches_analysis, opponent_id)
-
-            # Get and display basho details
-            basho_details = await get_basho_details(client, basho_id)
-            display_basho_details(basho_details)
-
-            # Search for rikishi and display results
-            rikishi_search = await search_rikishi(client, heya)
-            display_rikishi_search(rikishi_search)
+            display_rikishi_profile(summary)
+
+            # The remaining analyses are independent; with HTTP/2 enabled on the
+            # shared client they are multiplexed over a single connection
+            results = await batch_fetch(
+                [
+                    lambda: get_kimarite_analysis(client, "yorikiri"),
+                    lambda: get_rikishi_matches_analysis(
+                        client, rikishi_id, opponent_id
+                    ),
+                    lambda: get_basho_details(client, basho_id),
+                    lambda: search_rikishi(client, heya),
+                ]
+            )
+            displays = [
+                lambda analysis: display_kimarite_analysis(analysis, "yorikiri"),
+                lambda analysis: display_matches_analysis(analysis, opponent_id),
+                display_basho_details,
+                display_rikishi_search,
+            ]
+
+            # A failed analysis is reported without hiding the others
+            for display, result in zip(displays, results):
+                if isinstance(result, Exception):
+                    print(f"\nAn error occurred: {result!s}")
+                else:
+                    display(result)
 
         except httpx.HTTPStatusError as e:
             print(f"HTTP error occurred: {e.response.status_code}")
@@ -414,5 +767,27 @@ async def main():
             print(f"An error occurred: {e!s}")
 
 
+async def run(use_cache: bool = True) -> None:
+    """Run the example and close the shared client once at exit."""
+    try:
+        await main(use_cache)
+    finally:
+        await close_client()
+
+
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    # Use uvloop's faster event loop when it is installed (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"always fetch from the API instead of reusing responses in {_CACHE_DIR}",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(use_cache=not args.no_cache)))
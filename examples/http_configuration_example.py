@@ -1,24 +1,34 @@
 """
 Example demonstrating the HTTP configuration options in SumoClient.
 
-This example shows how to configure timeouts, HTTP/2, and retry behavior.
+This example shows how to configure timeouts, HTTP/2, connection pool limits,
+and retry behavior.
 """
 
 import asyncio
 from pysumoapi import SumoClient
 
 
+async def show_rikishi(client: SumoClient, rikishi_id: str = "1") -> None:
+    """Look up a rikishi and print the result or the error."""
+    try:
+        rikishi = await client.get_rikishi(rikishi_id)
+        print(f"Found rikishi: {rikishi.shikona_en}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
 async def main():
     """Demonstrate different HTTP configuration options."""
-    
+
+    # Each scenario below needs its own transport settings, so each opens its
+    # own client. In an application, open one client and reuse it for every
+    # request so its connection pool and TLS sessions stay warm, as here.
     print("1. Using default configuration (5s timeouts, HTTP/2, 2 retries):")
     async with SumoClient() as client:
-        try:
-            rikishi = await client.get_rikishi("1")
-            print(f"Found rikishi: {rikishi.shikona_en}")
-        except Exception as e:
-            print(f"Error: {e}")
-    
+        # All three lookups share the client's pooled connection
+        await asyncio.gather(*(show_rikishi(client, rid) for rid in ("1", "2", "3")))
+
     print("\n2. Custom configuration with longer timeouts and more retries:")
     async with SumoClient(
         connect_timeout=10.0,
@@ -26,13 +36,11 @@ async def main():
         max_retries=3,
         retry_backoff_factor=2.0,
         enable_http2=True,
+        max_connections=100,
+        max_keepalive_connections=100,
     ) as client:
-        try:
-            rikishi = await client.get_rikishi("1")
-            print(f"Found rikishi: {rikishi.shikona_en}")
-        except Exception as e:
-            print(f"Error: {e}")
-    
+        await show_rikishi(client)
+
     print("\n3. Minimal configuration (HTTP/1.1, no retries):")
     async with SumoClient(
         connect_timeout=2.0,
@@ -40,12 +48,15 @@ async def main():
         enable_http2=False,
         max_retries=0,
     ) as client:
-        try:
-            rikishi = await client.get_rikishi("1")
-            print(f"Found rikishi: {rikishi.shikona_en}")
-        except Exception as e:
-            print(f"Error: {e}")
+        await show_rikishi(client)
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
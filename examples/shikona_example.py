@@ -7,6 +7,7 @@ This script shows how to:
 2. Get shikona changes for a specific basho
 3. Sort shikona changes by basho ID
 4. Display shikona history for a rikishi
+5. Stream a large list of shikona changes as it arrives
 """
 
 import asyncio
@@ -26,11 +27,6 @@ async def get_rikishi_shikona_history(
     return await client.get_shikonas(rikishi_id=rikishi_id, sort_order="asc")
 
 
-async def get_basho_shikonas(client: SumoClient, basho_id: str) -> list[Shikona]:
-    """Get all shikona changes for a specific basho."""
-    return await client.get_shikonas(basho_id=basho_id, sort_order="asc")
-
-
 def display_shikona_history(shikonas: List[Shikona], title: str) -> None:
     """
     Display shikona history in a formatted way.
@@ -39,18 +35,18 @@ def display_shikona_history(shikonas: List[Shikona], title: str) -> None:
         shikonas: List of Shikona objects
         title: Title for the display
     """
-    print(f"\n{title}")
-    print("=" * 50)
-    print(f"Found {len(shikonas)} shikona records")
-    print("-" * 50)
+    # Collect output lines and write them in one call rather than per line
+    out = [f"\n{title}", "=" * 50, f"Found {len(shikonas)} shikona records", "-" * 50]
 
     for shikona in shikonas:
-        print(f"\nBasho: {shikona.basho_id}")
-        print(f"Rikishi ID: {shikona.rikishi_id}")
-        print(f"Shikona (EN): {shikona.shikona_en}")
+        out.append(f"\nBasho: {shikona.basho_id}")
+        out.append(f"Rikishi ID: {shikona.rikishi_id}")
+        out.append(f"Shikona (EN): {shikona.shikona_en}")
         if shikona.shikona_jp:
-            print(f"Shikona (JP): {shikona.shikona_jp}")
-        print("-" * 30)
+            out.append(f"Shikona (JP): {shikona.shikona_jp}")
+        out.append("-" * 30)
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def main():
@@ -64,11 +60,12 @@ async def main():
             for shikona in shikonas:
                 print(f"Basho: {shikona.basho_id}, Shikona: {shikona.shikona_en}")
 
-            # Get all shikona changes for a specific basho
+            # Stream all shikona changes for a specific basho; records are
+            # printed as they arrive, in the API's order, instead of after the
+            # whole list is loaded
             basho_id = "202305"  # Example basho ID
-            shikonas = await get_basho_shikonas(client, basho_id)
             print(f"\nShikona changes in Basho {basho_id}:")
-            for shikona in shikonas:
+            async for shikona in client.stream_shikonas(basho_id=basho_id):
                 print(f"Rikishi: {shikona.rikishi_id}, Shikona: {shikona.shikona_en}")
 
         except httpx.HTTPStatusError as e:
@@ -79,4 +76,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     sys.exit(asyncio.run(main()))
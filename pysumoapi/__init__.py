@@ -1,6 +1,18 @@
 """Python client for the Sumo API."""
 
-from pysumoapi.client import SumoClient, SumoSyncClient
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pysumoapi.client import SumoClient, SumoSyncClient
 
 __version__ = "0.3.0"
 __all__ = ["SumoClient", "SumoSyncClient"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the client (and httpx/pydantic with it) only when first used
+    if name in __all__:
+        from pysumoapi import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,39 @@
-from datetime import datetime
-from typing import Any, Dict, Optional
+import asyncio
+import codecs
+import functools
+import hashlib
+import json
+import os
+import re
+import ssl
+import time
+import typing
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from operator import attrgetter
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from pysumoapi.models import (
     Banzuke,
     Basho,
     KimariteMatchesResponse,
     KimariteResponse,
-    Match,
     Measurement,
     MeasurementsResponse,
     Rank,
@@ -23,6 +48,220 @@ from pysumoapi.models import (
     Torikumi,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+
+    def _json_loads(content: bytes) -> Any:
+        """Decode a JSON body."""
+        return json.loads(content)
+
+else:
+
+    def _json_loads(content: bytes) -> Any:
+        """Decode a JSON body with orjson."""
+        return orjson.loads(content)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+T = TypeVar("T")
+
+
+@overload
+def _validate_json(model: Type[ModelT], content: bytes) -> ModelT: ...
+
+
+@overload
+def _validate_json(model: "TypeAdapter[T]", content: bytes) -> T: ...
+
+
+def _validate_json(
+    model: Union[Type[BaseModel], "TypeAdapter[Any]"], content: bytes
+) -> Any:
+    """Validate a raw JSON body directly into a model or a TypeAdapter's type.
+
+    Raises:
+        RuntimeError: If the body is not valid JSON
+    """
+    try:
+        if isinstance(model, TypeAdapter):
+            return model.validate_json(content)
+        return model.model_validate_json(content)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise RuntimeError(f"Invalid JSON from API: {e}") from e
+        raise
+
+
+def _field_names(model: Type[BaseModel]) -> Dict[str, str]:
+    """Map a model's JSON keys (aliases) to its field names."""
+    return {field.alias or name: name for name, field in model.model_fields.items()}
+
+
+# Alias to field name tables for the models built by _construct
+_FIELD_NAMES: Dict[Type[BaseModel], Dict[str, str]] = {
+    model: _field_names(model) for model in (Measurement, Rank, Shikona)
+}
+
+
+# Validators that parse and validate a whole JSON array of records in one pass
+_RECORD_LIST_ADAPTERS: Dict[Type[BaseModel], "TypeAdapter[List[Any]]"] = {
+    Measurement: TypeAdapter(List[Measurement]),
+    Rank: TypeAdapter(List[Rank]),
+    Shikona: TypeAdapter(List[Shikona]),
+}
+
+
+def _construct(model: Type[ModelT], item: Dict[str, Any]) -> ModelT:
+    """Build a model from a trusted API record without validating it."""
+    names = _FIELD_NAMES[model]
+    return model.model_construct(
+        **{names.get(key, key): value for key, value in item.items()}
+    )
+
+
+_JSON_SEPARATORS = " \t\r\n,"
+
+
+async def _iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Incrementally decode the items of a JSON array from a byte stream.
+
+    Raises:
+        RuntimeError: If the stream is not a complete JSON array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+
+    async for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_SEPARATORS:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise RuntimeError("Invalid JSON from API: expected an array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The next item is incomplete; wait for more data
+                break
+            yield item
+        buffer = buffer[pos:]
+
+    raise RuntimeError("Invalid JSON from API: unterminated array")
+
+
+# Query string spellings of boolean filters
+_BOOL_STR = {True: "true", False: "false"}
+
+# Query for get_rikishis() called without arguments. Shared between calls,
+# so it must never be mutated.
+_DEFAULT_RIKISHIS_PARAMS: Dict[str, Any] = {
+    "limit": 10,
+    "skip": 0,
+    "measurements": "true",
+    "ranks": "true",
+    "shikonas": "true",
+}
+
+# Banzuke response keys and the side names stored on each rikishi
+_BANZUKE_SIDES = (("east", "East"), ("west", "West"))
+
+# Sort key for measurement, rank and shikona records
+_BASHO_KEY = attrgetter("basho_id")
+
+_VALID_DIVISIONS = frozenset(
+    ("Makuuchi", "Juryo", "Makushita", "Sandanme", "Jonidan", "Jonokuchi")
+)
+
+_BASHO_ID_RE = re.compile(r"\A[0-9]{4}(?:0[1-9]|1[0-2])\Z")
+
+
+def _validate_basho_id(basho_id: str) -> None:
+    """Check that a basho ID is in YYYYMM format.
+
+    Raises:
+        ValueError: If the ID is not six ASCII digits ending in a valid month
+    """
+    if not _BASHO_ID_RE.match(basho_id):
+        raise ValueError("Basho ID must be in YYYYMM format")
+
+
+def _is_future_basho(basho_id: str) -> bool:
+    """Return whether a validated YYYYMM basho ID lies after the current month."""
+    now = time.localtime()
+    return int(basho_id) > now.tm_year * 100 + now.tm_mon
+
+
+# In-memory LRU cache of GET responses: (path, sorted query items) mapped to
+# (monotonic expiry time, response body)
+_MemoryCacheKey = Tuple[str, Tuple[Any, ...]]
+_MemoryCache = typing.OrderedDict[_MemoryCacheKey, Tuple[float, bytes]]
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _cache_ttl(cache_control: Optional[str], default: float) -> float:
+    """Determine how long a response may be cached from its Cache-Control header."""
+    if not cache_control:
+        return default
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else default
+
+
+def _read_cache(cache_path: Path) -> Optional[bytes]:
+    """Return a cached response body if present and still fresh."""
+    try:
+        with open(cache_path, "rb") as f:
+            expires = float(f.readline())
+            content = f.read()
+    except (OSError, ValueError):
+        return None
+    if expires < time.time():
+        return None
+    return content
+
+
+def _write_cache(cache_path: Path, content: bytes, ttl: float) -> None:
+    """Atomically write a response body to the cache, prefixed by its expiry time.
+
+    A cache that can't be written is skipped, like one that can't be read.
+    """
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(f"{time.time() + ttl}\n".encode())
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+@functools.cache
+def _ssl_context(cafile: str) -> ssl.SSLContext:
+    """Create an SSL context for a CA bundle, loading each bundle only once.
+
+    Parsing the bundle is the costliest part of opening a client, and the
+    resulting context is safe to share between clients.
+    """
+    return ssl.create_default_context(cafile=cafile)
+
 
 class SumoClient:
     """Client for interacting with the Sumo API."""
@@ -36,6 +275,14 @@ class SumoClient:
         enable_http2: bool = True,
         max_retries: int = 2,
         retry_backoff_factor: float = 1.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: float = 3600.0,
+        cache_size: int = 0,
+        max_concurrency: Optional[int] = None,
+        trust_server: bool = False,
     ):
         """Initialize the client with the base URL and HTTP configuration.
 
@@ -46,7 +293,22 @@ class SumoClient:
             read_timeout: Read timeout in seconds
             enable_http2: Whether to enable HTTP/2 support
             max_retries: Maximum number of retry attempts
-            retry_backoff_factor: Factor for exponential backoff (delay = factor * (2 ** attempt))
+            retry_backoff_factor: Factor for exponential backoff
+                (delay = factor * (2 ** attempt))
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive
+            keepalive_expiry: Seconds an idle connection is kept open for reuse
+            cache_dir: Directory for caching GET responses on disk
+                (disabled if None)
+            cache_ttl: Seconds a cached response stays fresh when the API sends
+                no max-age
+            cache_size: Number of GET responses to keep in an in-memory LRU
+                cache (disabled if 0)
+            max_concurrency: Maximum number of requests in flight at once
+                (unlimited if None)
+            trust_server: Build measurement, rank and shikona records without
+                validating them, for speed on large responses from a trusted API
         """
         self.base_url = base_url.rstrip("/")
         self._client: Optional[httpx.AsyncClient] = None
@@ -56,17 +318,49 @@ class SumoClient:
         self.enable_http2 = enable_http2
         self.max_retries = max_retries
         self.retry_backoff_factor = retry_backoff_factor
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._memory_cache: _MemoryCache = OrderedDict()
+        self.max_concurrency = max_concurrency
+        self.trust_server = trust_server
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._persistent = False
+        # Open ``async with`` blocks, so nested blocks don't close the client
+        self._entries = 0
+
+    @classmethod
+    def persistent(cls, *args: Any, **kwargs: Any) -> "SumoClient":
+        """Create a client whose connections outlive each ``async with`` block.
+
+        The HTTP client is opened on the first entry and reused by later
+        entries, so the connection pool and TLS sessions are kept between
+        blocks. Call ``aclose()`` once the client is no longer needed.
+
+        Args:
+            *args: Positional arguments to pass to SumoClient
+            **kwargs: Keyword arguments to pass to SumoClient
+        """
+        client = cls(*args, **kwargs)
+        client._persistent = True
+        return client
 
     async def __aenter__(self) -> "SumoClient":
         """Create an async context manager."""
-        import ssl
+        if self._client is not None:
+            # Already open: a persistent client, or a nested ``async with``
+            self._entries += 1
+            return self
 
         # Configure SSL verification
         if self.verify_ssl:
             try:
                 import certifi
 
-                ssl_context = ssl.create_default_context(cafile=certifi.where())
+                ssl_context = _ssl_context(certifi.where())
             except (ImportError, FileNotFoundError):
                 raise RuntimeError(
                     "certifi not available; set verify_ssl=False to proceed"
@@ -82,10 +376,22 @@ class SumoClient:
             pool=self.connect_timeout,  # Use connect timeout for pool
         )
 
-        # Configure retry transport
+        # Configure connection pool limits
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+        # Configure retry transport. httpx ignores the client-level verify,
+        # http2 and limits settings when a transport is supplied, so they
+        # must be set on the transport itself.
         from httpx import AsyncHTTPTransport
 
         transport = AsyncHTTPTransport(
+            verify=ssl_context,
+            http2=self.enable_http2,
+            limits=limits,
             retries=self.max_retries,
         )
 
@@ -94,14 +400,27 @@ class SumoClient:
             verify=ssl_context,
             timeout=timeout,
             http2=self.enable_http2,
+            limits=limits,
             transport=transport,
         )
+
+        # Created here rather than in __init__ so it binds to the running loop
+        if self.max_concurrency:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._entries = 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up the async client."""
+        """Close the client when the outermost block exits, unless persistent."""
+        self._entries = max(self._entries - 1, 0)
+        if self._entries == 0 and not self._persistent:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
         if self._client:
             await self._client.aclose()
+            self._client = None
 
     async def _make_request(
         self, method: str, path: str, params: Optional[Dict[str, Any]] = None
@@ -122,11 +441,102 @@ class SumoClient:
             ValueError: If the API returns a 404 with a specific error message
             RuntimeError: If the response contains invalid JSON
         """
+        content = await self._request_content(method, path, params=params)
+
+        try:
+            return _json_loads(content)
+        except Exception as e:
+            raise RuntimeError(f"Invalid JSON from API: {e}") from e
+
+    async def _request_content(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Make a request to the Sumo API and return the raw response body.
+
+        Args:
+            method: HTTP method to use
+            path: API endpoint path
+            params: Optional query parameters
+
+        Returns:
+            Raw JSON response body
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status code
+            ValueError: If the API returns a 404 with a specific error message
+        """
         if not self._client:
             raise RuntimeError("Client must be used as an async context manager")
 
-        response = await self._client.request(method, path, params=params)
+        memory_key = None
+        if method == "GET" and self.cache_size:
+            memory_key = (path, tuple(sorted((params or {}).items())))
+            cached = self._memory_cache_get(memory_key)
+            if cached is not None:
+                return cached
+
+        cache_path = self._cache_path(path, params) if method == "GET" else None
+        if cache_path is not None:
+            cached = _read_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        async with self._request_slot():
+            response = await self._client.request(method, path, params=params)
+        self._check_response(response)
+        content = response.content
+
+        if cache_path is not None or memory_key is not None:
+            ttl = _cache_ttl(response.headers.get("cache-control"), self.cache_ttl)
+            if ttl > 0:
+                if cache_path is not None:
+                    # Write in a thread so file I/O doesn't block the event loop
+                    await asyncio.to_thread(_write_cache, cache_path, content, ttl)
+                if memory_key is not None:
+                    self._memory_cache_put(memory_key, content, ttl)
+
+        return content
+
+    def _memory_cache_get(self, key: _MemoryCacheKey) -> Optional[bytes]:
+        """Return a fresh response body from the in-memory cache, if present."""
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+        expires, content = entry
+        if expires < time.monotonic():
+            del self._memory_cache[key]
+            return None
+        self._memory_cache.move_to_end(key)
+        return content
+
+    def _memory_cache_put(
+        self, key: _MemoryCacheKey, content: bytes, ttl: float
+    ) -> None:
+        """Store a response body in the in-memory cache, evicting the oldest entry."""
+        self._memory_cache[key] = (time.monotonic() + ttl, content)
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > self.cache_size:
+            self._memory_cache.popitem(last=False)
+
+    def _cache_path(
+        self, path: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[Path]:
+        """Return the on-disk cache file for a request, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = json.dumps([self.base_url, path, params or {}], sort_keys=True)
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _check_response(response: httpx.Response) -> None:
+        """
+        Raise for API error responses.
 
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status code
+            ValueError: If the API returns a 404 with a specific error message
+        """
         # Handle 404 errors with specific error messages
         if response.status_code == 404:
             try:
@@ -139,20 +549,123 @@ class SumoClient:
 
         response.raise_for_status()
 
+    async def _stream_records(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the records of a JSON array response from the Sumo API.
+
+        Records are yielded as soon as they have been received, so the full
+        response body is never held in memory at once.
+
+        Args:
+            path: API endpoint path
+            params: Optional query parameters
+
+        Yields:
+            Each JSON object in the response array
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status code
+            ValueError: If the API returns a 404 with a specific error message
+            RuntimeError: If the response is not a valid JSON array
+        """
+        if not self._client:
+            raise RuntimeError("Client must be used as an async context manager")
+
+        # Hold a request slot only until the response is open, so the caller
+        # can make other requests while iterating over the records
+        request = self._client.build_request("GET", path, params=params)
+        async with self._request_slot():
+            response = await self._client.send(request, stream=True)
+            if response.is_error:
+                try:
+                    await response.aread()
+                    self._check_response(response)
+                finally:
+                    await response.aclose()
+
         try:
-            return response.json()
-        except Exception as e:
-            raise RuntimeError(f"Invalid JSON from API: {e}") from e
+            async for record in _iter_json_array(response.aiter_bytes()):
+                yield record
+        finally:
+            await response.aclose()
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Wait for a free request slot when max_concurrency is set."""
+        if self._semaphore is None:
+            yield
+        else:
+            async with self._semaphore:
+                yield
+
+    async def _get_records(
+        self, model: Type[ModelT], path: str, params: Dict[str, Any]
+    ) -> List[ModelT]:
+        """Fetch a JSON array of measurement, rank or shikona records as models."""
+        if self.trust_server:
+            # Record endpoints return a JSON array rather than an object
+            data = cast(
+                List[Dict[str, Any]],
+                await self._make_request("GET", path, params=params),
+            )
+            return [_construct(model, item) for item in data]
+
+        content = await self._request_content("GET", path, params=params)
+        return _validate_json(_RECORD_LIST_ADAPTERS[model], content)
+
+    def _build_record(self, model: Type[ModelT], item: Dict[str, Any]) -> ModelT:
+        """Convert a measurement, rank or shikona record into its model."""
+        if self.trust_server:
+            return _construct(model, item)
+        return model.model_validate(item)
+
+    @staticmethod
+    def _history_params(
+        basho_id: Optional[str], rikishi_id: Optional[int], sort_order: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Validate the filters shared by the measurements, ranks and shikonas endpoints.
+
+        Returns:
+            Query parameters for the request
+
+        Raises:
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
+        """
+        # Validate parameters
+        if not basho_id and not rikishi_id:
+            raise ValueError("Either basho_id or rikishi_id must be provided")
+
+        if basho_id:
+            _validate_basho_id(basho_id)
+
+        if rikishi_id is not None and rikishi_id <= 0:
+            raise ValueError("Rikishi ID must be positive")
+
+        if sort_order and sort_order not in ["asc", "desc"]:
+            raise ValueError("Sort order must be either 'asc' or 'desc'")
+
+        # Build query parameters
+        params: Dict[str, Any] = {}
+        if basho_id:
+            params["bashoId"] = basho_id
+        if rikishi_id:
+            params["rikishiId"] = rikishi_id
+
+        return params
 
     async def get_rikishi(self, rikishi_id: str) -> Rikishi:
         """Get a single rikishi by ID."""
-        data = await self._make_request("GET", f"/rikishi/{rikishi_id}")
-        return Rikishi.model_validate(data)
+        content = await self._request_content("GET", f"/rikishi/{rikishi_id}")
+        return _validate_json(Rikishi, content)
 
     async def get_rikishi_stats(self, rikishi_id: str) -> RikishiStats:
         """Get statistics for a rikishi."""
-        data = await self._make_request("GET", f"/rikishi/{rikishi_id}/stats")
-        return RikishiStats.model_validate(data)
+        content = await self._request_content("GET", f"/rikishi/{rikishi_id}/stats")
+        return _validate_json(RikishiStats, content)
 
     async def get_rikishis(
         self,
@@ -168,27 +681,56 @@ class SumoClient:
         skip: int = 0,
     ) -> RikishiList:
         """Get a list of rikishi with optional filters."""
+        filtered = shikona_en or heya or sumodb_id or nsk_id or intai is not None
+        if (
+            not filtered
+            and limit == 10
+            and skip == 0
+            and measurements is True
+            and ranks is True
+            and shikonas is True
+        ):
+            # The common unfiltered call reuses a prebuilt query
+            content = await self._request_content(
+                "GET", "/rikishis", params=_DEFAULT_RIKISHIS_PARAMS
+            )
+            return _validate_json(RikishiList, content)
+
         params = {
             "limit": limit,
             "skip": skip,
-            "measurements": str(measurements).lower(),
-            "ranks": str(ranks).lower(),
-            "shikonas": str(shikonas).lower(),
+            "measurements": _BOOL_STR[bool(measurements)],
+            "ranks": _BOOL_STR[bool(ranks)],
+            "shikonas": _BOOL_STR[bool(shikonas)],
         }
 
-        if shikona_en:
-            params["shikonaEn"] = shikona_en
-        if heya:
-            params["heya"] = heya
-        if sumodb_id:
-            params["sumodbId"] = sumodb_id
-        if nsk_id:
-            params["nskId"] = nsk_id
+        filters = (
+            ("shikonaEn", shikona_en),
+            ("heya", heya),
+            ("sumodbId", sumodb_id),
+            ("nskId", nsk_id),
+        )
+        params.update({key: value for key, value in filters if value})
         if intai is not None:
-            params["intai"] = str(intai).lower()
+            params["intai"] = _BOOL_STR[bool(intai)]
 
-        data = await self._make_request("GET", "/rikishis", params=params)
-        return RikishiList.model_validate(data)
+        content = await self._request_content("GET", "/rikishis", params=params)
+        return _validate_json(RikishiList, content)
+
+    async def get_rikishis_batch(self, rikishi_ids: List[str]) -> List[Rikishi]:
+        """
+        Get several rikishi by ID, fetching them concurrently.
+
+        The requests share the client's connection pool (multiplexed over one
+        connection with HTTP/2) and are bounded by max_concurrency if set.
+
+        Args:
+            rikishi_ids: IDs of the rikishi to fetch
+
+        Returns:
+            The rikishi, in the same order as rikishi_ids
+        """
+        return list(await asyncio.gather(*(self.get_rikishi(i) for i in rikishi_ids)))
 
     async def get_rikishi_matches(
         self, rikishi_id: int, basho_id: Optional[str] = None
@@ -209,17 +751,17 @@ class SumoClient:
         if rikishi_id <= 0:
             raise ValueError("Rikishi ID must be positive")
 
-        if basho_id and not (basho_id.isdigit() and len(basho_id) == 6):
-            raise ValueError("Basho ID must be in YYYYMM format")
+        if basho_id:
+            _validate_basho_id(basho_id)
 
         params = {}
         if basho_id:
             params["bashoId"] = basho_id
 
-        data = await self._make_request(
+        content = await self._request_content(
             "GET", f"/rikishi/{rikishi_id}/matches", params=params
         )
-        return RikishiMatchesResponse.model_validate(data)
+        return _validate_json(RikishiMatchesResponse, content)
 
     async def get_rikishi_opponent_matches(
         self, rikishi_id: int, opponent_id: int, basho_id: Optional[str] = None
@@ -244,17 +786,17 @@ class SumoClient:
         if opponent_id <= 0:
             raise ValueError("Opponent ID must be positive")
 
-        if basho_id and not (basho_id.isdigit() and len(basho_id) == 6):
-            raise ValueError("Basho ID must be in YYYYMM format")
+        if basho_id:
+            _validate_basho_id(basho_id)
 
         params = {}
         if basho_id:
             params["bashoId"] = basho_id
 
-        data = await self._make_request(
+        content = await self._request_content(
             "GET", f"/rikishi/{rikishi_id}/matches/{opponent_id}", params=params
         )
-        return RikishiOpponentMatchesResponse.model_validate(data)
+        return _validate_json(RikishiOpponentMatchesResponse, content)
 
     async def get_basho(self, basho_id: str) -> Basho:
         """
@@ -269,18 +811,29 @@ class SumoClient:
         Raises:
             ValueError: If basho_id format is incorrect or date is in the future
         """
-        if not (basho_id.isdigit() and len(basho_id) == 6):
-            raise ValueError("Basho ID must be in YYYYMM format")
+        _validate_basho_id(basho_id)
 
         # Check if date is in the future
-        year = int(basho_id[:4])
-        month = int(basho_id[4:])
-        basho_date = datetime(year, month, 1)
-        if basho_date > datetime.now():
+        if _is_future_basho(basho_id):
             raise ValueError("Cannot get details for future basho")
 
-        data = await self._make_request("GET", f"/basho/{basho_id}")
-        return Basho.model_validate(data)
+        content = await self._request_content("GET", f"/basho/{basho_id}")
+        return _validate_json(Basho, content)
+
+    async def get_basho_batch(self, basho_ids: List[str]) -> List[Basho]:
+        """
+        Get details for several basho tournaments, fetching them concurrently.
+
+        Args:
+            basho_ids: Basho IDs in YYYYMM format
+
+        Returns:
+            The basho, in the same order as basho_ids
+
+        Raises:
+            ValueError: If any basho_id format is incorrect or date is in the future
+        """
+        return list(await asyncio.gather(*(self.get_basho(i) for i in basho_ids)))
 
     async def get_banzuke(self, basho_id: str, division: str) -> Banzuke:
         """Get banzuke details for a specific basho and division.
@@ -296,51 +849,54 @@ class SumoClient:
             ValueError: If basho_id is invalid or in the future, or if division is invalid
         """
         # Validate basho_id format
-        try:
-            year = int(basho_id[:4])
-            month = int(basho_id[4:])
-            basho_date = datetime(year, month, 1)
-        except (ValueError, IndexError):
-            raise ValueError("Basho ID must be in YYYYMM format")
+        _validate_basho_id(basho_id)
 
         # Check if basho is in the future
-        if basho_date > datetime.now():
+        if _is_future_basho(basho_id):
             raise ValueError("Cannot fetch future basho")
 
         # Validate division
-        valid_divisions = [
-            "Makuuchi",
-            "Juryo",
-            "Makushita",
-            "Sandanme",
-            "Jonidan",
-            "Jonokuchi",
-        ]
-        if division not in valid_divisions:
+        if division not in _VALID_DIVISIONS:
             raise ValueError("Invalid division")
 
         data = await self._make_request("GET", f"/basho/{basho_id}/banzuke/{division}")
 
-        # Process east and west sides
-        for side in ["east", "west"]:
-            if side in data:
-                for rikishi in data[side]:
-                    # Add side to each rikishi
-                    rikishi["side"] = side.title()
-                    # Convert record to Match objects
-                    if "record" in rikishi:
-                        # Add basho_id to each match record
-                        for match in rikishi["record"]:
-                            match["bashoId"] = basho_id
-                        rikishi["record"] = [
-                            Match.from_banzuke(match) for match in rikishi["record"]
-                        ]
+        # Process east and west sides in one pass over each rikishi and match.
+        # Matches get the fields banzuke records omit, then are validated as
+        # Match models together with the rest of the response.
+        for side, side_name in _BANZUKE_SIDES:
+            for rikishi in data.get(side, ()):
+                rikishi["side"] = side_name
+                for match in rikishi.get("record", ()):
+                    # Banzuke records don't include the basho or day
+                    match.update(bashoId=basho_id, day=1)
+                    match.setdefault("opponentShikonaJp", "")
 
         # Ensure bashoId is set
         data["bashoId"] = basho_id
 
         return Banzuke.model_validate(data)
 
+    async def get_banzuke_batch(
+        self, basho_ids: List[str], division: str
+    ) -> List[Banzuke]:
+        """Get the banzuke of one division for several basho concurrently.
+
+        Args:
+            basho_ids: Basho IDs in YYYYMM format
+            division: Division name (Makuuchi, Juryo, Makushita, Sandanme, Jonidan, Jonokuchi)
+
+        Returns:
+            The banzuke, in the same order as basho_ids
+
+        Raises:
+            ValueError: If any basho_id is invalid or in the future, or if
+                division is invalid
+        """
+        return list(
+            await asyncio.gather(*(self.get_banzuke(i, division) for i in basho_ids))
+        )
+
     async def get_torikumi(self, basho_id: str, division: str, day: int) -> Torikumi:
         """Get torikumi details for a specific basho, division, and day.
 
@@ -356,27 +912,14 @@ class SumoClient:
             ValueError: If basho_id is invalid or in the future, division is invalid, or day is out of range
         """
         # Validate basho_id format
-        try:
-            year = int(basho_id[:4])
-            month = int(basho_id[4:])
-            basho_date = datetime(year, month, 1)
-        except (ValueError, IndexError):
-            raise ValueError("Basho ID must be in YYYYMM format")
+        _validate_basho_id(basho_id)
 
         # Check if basho is in the future
-        if basho_date > datetime.now():
+        if _is_future_basho(basho_id):
             raise ValueError("Cannot fetch future basho")
 
         # Validate division
-        valid_divisions = [
-            "Makuuchi",
-            "Juryo",
-            "Makushita",
-            "Sandanme",
-            "Jonidan",
-            "Jonokuchi",
-        ]
-        if division not in valid_divisions:
+        if division not in _VALID_DIVISIONS:
             raise ValueError("Invalid division")
 
         # Validate day
@@ -387,12 +930,8 @@ class SumoClient:
             "GET", f"/basho/{basho_id}/torikumi/{division}/{day}"
         )
 
-        # Convert matches to use the unified Match model
-        if "torikumi" in data:
-            data["torikumi"] = [
-                Match.from_torikumi(match) for match in data["torikumi"]
-            ]
-
+        # Matches already use the unified Match model's keys, so they are
+        # validated together with the rest of the response below
         # Handle both 'bashoId' and 'date' fields in the response
         if "bashoId" not in data and "date" in data:
             data["bashoId"] = data["date"]
@@ -456,8 +995,8 @@ class SumoClient:
         if skip:
             params["skip"] = skip
 
-        data = await self._make_request("GET", "/kimarite", params=params)
-        return KimariteResponse(**data)
+        content = await self._request_content("GET", "/kimarite", params=params)
+        return _validate_json(KimariteResponse, content)
 
     async def get_kimarite_matches(
         self,
@@ -505,8 +1044,10 @@ class SumoClient:
         if skip:
             params["skip"] = skip
 
-        data = await self._make_request("GET", f"/kimarite/{kimarite}", params=params)
-        return KimariteMatchesResponse(**data)
+        content = await self._request_content(
+            "GET", f"/kimarite/{kimarite}", params=params
+        )
+        return _validate_json(KimariteMatchesResponse, content)
 
     async def get_measurements(
         self,
@@ -525,35 +1066,16 @@ class SumoClient:
             List[Measurement] containing measurement records
 
         Raises:
-            ValueError: If parameters are invalid or neither basho_id nor rikishi_id is provided
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
         """
-        # Validate parameters
-        if not basho_id and not rikishi_id:
-            raise ValueError("Either basho_id or rikishi_id must be provided")
-
-        if basho_id and not (basho_id.isdigit() and len(basho_id) == 6):
-            raise ValueError("Basho ID must be in YYYYMM format")
-
-        if rikishi_id is not None and rikishi_id <= 0:
-            raise ValueError("Rikishi ID must be positive")
-
-        if sort_order and sort_order not in ["asc", "desc"]:
-            raise ValueError("Sort order must be either 'asc' or 'desc'")
-
-        # Build query parameters
-        params: Dict[str, Any] = {}
-        if basho_id:
-            params["bashoId"] = basho_id
-        if rikishi_id:
-            params["rikishiId"] = rikishi_id
+        params = self._history_params(basho_id, rikishi_id, sort_order)
 
-        data = await self._make_request("GET", "/measurements", params=params)
-        # Convert each item in the list to a Measurement model
-        measurements = [Measurement.model_validate(item) for item in data]
+        measurements = await self._get_records(Measurement, "/measurements", params)
 
         # Sort by basho_id if requested
         if sort_order:
-            measurements.sort(key=lambda m: m.basho_id, reverse=(sort_order == "desc"))
+            measurements.sort(key=_BASHO_KEY, reverse=(sort_order == "desc"))
 
         return measurements
 
@@ -574,35 +1096,16 @@ class SumoClient:
             List[Rank] containing rank records
 
         Raises:
-            ValueError: If parameters are invalid or neither basho_id nor rikishi_id is provided
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
         """
-        # Validate parameters
-        if not basho_id and not rikishi_id:
-            raise ValueError("Either basho_id or rikishi_id must be provided")
-
-        if basho_id and not (basho_id.isdigit() and len(basho_id) == 6):
-            raise ValueError("Basho ID must be in YYYYMM format")
-
-        if rikishi_id is not None and rikishi_id <= 0:
-            raise ValueError("Rikishi ID must be positive")
+        params = self._history_params(basho_id, rikishi_id, sort_order)
 
-        if sort_order and sort_order not in ["asc", "desc"]:
-            raise ValueError("Sort order must be either 'asc' or 'desc'")
-
-        # Build query parameters
-        params: Dict[str, Any] = {}
-        if basho_id:
-            params["bashoId"] = basho_id
-        if rikishi_id:
-            params["rikishiId"] = rikishi_id
-
-        data = await self._make_request("GET", "/ranks", params=params)
-        # Convert each item in the list to a Rank model
-        ranks = [Rank.model_validate(item) for item in data]
+        ranks = await self._get_records(Rank, "/ranks", params)
 
         # Sort by basho_id if requested
         if sort_order:
-            ranks.sort(key=lambda r: r.basho_id, reverse=(sort_order == "desc"))
+            ranks.sort(key=_BASHO_KEY, reverse=(sort_order == "desc"))
 
         return ranks
 
@@ -623,37 +1126,96 @@ class SumoClient:
             List[Shikona] containing shikona records
 
         Raises:
-            ValueError: If parameters are invalid or neither basho_id nor rikishi_id is provided
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
         """
-        # Validate parameters
-        if not basho_id and not rikishi_id:
-            raise ValueError("Either basho_id or rikishi_id must be provided")
+        params = self._history_params(basho_id, rikishi_id, sort_order)
 
-        if basho_id and not (basho_id.isdigit() and len(basho_id) == 6):
-            raise ValueError("Basho ID must be in YYYYMM format")
+        shikonas = await self._get_records(Shikona, "/shikonas", params)
 
-        if rikishi_id is not None and rikishi_id <= 0:
-            raise ValueError("Rikishi ID must be positive")
+        # Sort by basho_id if requested
+        if sort_order:
+            shikonas.sort(key=_BASHO_KEY, reverse=(sort_order == "desc"))
 
-        if sort_order and sort_order not in ["asc", "desc"]:
-            raise ValueError("Sort order must be either 'asc' or 'desc'")
+        return shikonas
 
-        # Build query parameters
-        params: Dict[str, Any] = {}
-        if basho_id:
-            params["bashoId"] = basho_id
-        if rikishi_id:
-            params["rikishiId"] = rikishi_id
+    async def stream_measurements(
+        self,
+        basho_id: Optional[str] = None,
+        rikishi_id: Optional[int] = None,
+    ) -> AsyncIterator[Measurement]:
+        """Stream measurement changes by rikishi or basho.
 
-        data = await self._make_request("GET", "/shikonas", params=params)
-        # Convert each item in the list to a Shikona model
-        shikonas = [Shikona.model_validate(item) for item in data]
+        Unlike get_measurements, records are yielded as they arrive and in the
+        order the API returns them; use get_measurements for sorted results.
 
-        # Sort by basho_id if requested
-        if sort_order:
-            shikonas.sort(key=lambda s: s.basho_id, reverse=(sort_order == "desc"))
+        Args:
+            basho_id: Optional basho ID in YYYYMM format to filter measurements
+            rikishi_id: Optional rikishi ID to filter measurements
 
-        return shikonas
+        Yields:
+            Measurement records
+
+        Raises:
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
+        """
+        params = self._history_params(basho_id, rikishi_id, None)
+
+        async for item in self._stream_records("/measurements", params=params):
+            yield self._build_record(Measurement, item)
+
+    async def stream_ranks(
+        self,
+        basho_id: Optional[str] = None,
+        rikishi_id: Optional[int] = None,
+    ) -> AsyncIterator[Rank]:
+        """Stream rank changes by rikishi or basho.
+
+        Unlike get_ranks, records are yielded as they arrive and in the
+        order the API returns them; use get_ranks for sorted results.
+
+        Args:
+            basho_id: Optional basho ID in YYYYMM format to filter ranks
+            rikishi_id: Optional rikishi ID to filter ranks
+
+        Yields:
+            Rank records
+
+        Raises:
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
+        """
+        params = self._history_params(basho_id, rikishi_id, None)
+
+        async for item in self._stream_records("/ranks", params=params):
+            yield self._build_record(Rank, item)
+
+    async def stream_shikonas(
+        self,
+        basho_id: Optional[str] = None,
+        rikishi_id: Optional[int] = None,
+    ) -> AsyncIterator[Shikona]:
+        """Stream shikona changes by rikishi or basho.
+
+        Unlike get_shikonas, records are yielded as they arrive and in the
+        order the API returns them; use get_shikonas for sorted results.
+
+        Args:
+            basho_id: Optional basho ID in YYYYMM format to filter shikonas
+            rikishi_id: Optional rikishi ID to filter shikonas
+
+        Yields:
+            Shikona records
+
+        Raises:
+            ValueError: If parameters are invalid or neither basho_id nor
+                rikishi_id is provided
+        """
+        params = self._history_params(basho_id, rikishi_id, None)
+
+        async for item in self._stream_records("/shikonas", params=params):
+            yield self._build_record(Shikona, item)
 
 
 import anyio
@@ -4,6 +4,25 @@ from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Keys copied verbatim from the raw records by the from_* constructors
+_TORIKUMI_KEYS = (
+    "bashoId",
+    "division",
+    "day",
+    "matchNo",
+    "eastId",
+    "eastShikona",
+    "eastRank",
+    "westId",
+    "westShikona",
+    "westRank",
+    "kimarite",
+    "winnerId",
+    "winnerEn",
+    "winnerJp",
+)
+_BANZUKE_KEYS = ("result", "opponentID", "opponentShikonaEn", "kimarite")
+
 
 class Match(BaseModel):
     """Unified model for sumo matches across all endpoints.
@@ -80,33 +99,16 @@ class Match(BaseModel):
     @classmethod
     def from_torikumi(cls, data: dict) -> "Match":
         """Create a Match instance from torikumi data."""
-        return cls(
-            id=data.get("id"),
-            bashoId=data["bashoId"],
-            division=data["division"],
-            day=data["day"],
-            matchNo=data["matchNo"],
-            eastId=data["eastId"],
-            eastShikona=data["eastShikona"],
-            eastRank=data["eastRank"],
-            westId=data["westId"],
-            westShikona=data["westShikona"],
-            westRank=data["westRank"],
-            kimarite=data["kimarite"],
-            winnerId=data["winnerId"],
-            winnerEn=data["winnerEn"],
-            winnerJp=data["winnerJp"],
-        )
+        fields = {key: data[key] for key in _TORIKUMI_KEYS}
+        fields["id"] = data.get("id")
+        return cls(**fields)
 
     @classmethod
     def from_banzuke(cls, data: dict) -> "Match":
         """Create a Match instance from banzuke data."""
-        return cls(
-            bashoId=data.get("bashoId", ""),  # This will be set by the client
-            day=1,  # Default to day 1 since banzuke records don't include day
-            result=data["result"],
-            opponentID=data["opponentID"],
-            opponentShikonaEn=data["opponentShikonaEn"],
-            opponentShikonaJp=data.get("opponentShikonaJp", ""),  # This might be empty
-            kimarite=data["kimarite"],
-        )
+        fields = {key: data[key] for key in _BANZUKE_KEYS}
+        # bashoId is set by the client and banzuke records don't include a day
+        fields["bashoId"] = data.get("bashoId", "")
+        fields["day"] = 1
+        fields["opponentShikonaJp"] = data.get("opponentShikonaJp", "")
+        return cls(**fields)
@@ -1,11 +1,13 @@
 """Models for rikishi statistics."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DivisionStats(BaseModel):
     """Model representing statistics by division."""
 
+    model_config = ConfigDict(frozen=True)
+
     Jonokuchi: int = 0
     Jonidan: int = 0
     Sandanme: int = 0
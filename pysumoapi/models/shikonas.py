@@ -1,11 +1,13 @@
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Shikona(BaseModel):
     """Model for a single shikona record."""
 
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     id: str = Field(..., description="Shikona ID in format YYYYMM-rikishiId")
     basho_id: str = Field(..., alias="bashoId", description="Basho ID in YYYYMM format")
     rikishi_id: int = Field(..., alias="rikishiId", description="Rikishi ID")
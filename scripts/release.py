@@ -7,27 +7,55 @@ import argparse
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Sequence
+
+from version import read_version
+
+try:
+    import pygit2
+except ImportError:  # Fall back to the git command line (pygit2 is a dev extra)
+    pygit2 = None
 
 
 def run_command(
-    cmd: List[str], cwd: Optional[Path] = None
+    cmd: Sequence[str], /, cwd: Optional[Path] = None, *, capture: bool = True
 ) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
+    """Run a command and return the result.
+
+    With capture=False the command writes straight to the terminal, for steps
+    whose output is only shown to the user.
+    """
     try:
-        return subprocess.run(cmd, cwd=cwd, check=True, capture_output=True, text=True)
+        return subprocess.run(
+            cmd, cwd=cwd, check=True, capture_output=capture, text=capture
+        )
     except subprocess.CalledProcessError as e:
         print(f"Error running command: {' '.join(cmd)}")
         print(f"Exit code: {e.returncode}")
-        print(f"Output: {e.output}")
+        if capture:
+            print(f"Output: {e.output}")
         sys.exit(1)
 
 
+def open_repo() -> "Optional[pygit2.Repository]":
+    """Open the current git repository in-process, if pygit2 is installed."""
+    if pygit2 is None:
+        return None
+    # Each check opens its own handle since they run on separate threads
+    return pygit2.Repository(pygit2.discover_repository(os.getcwd()))
+
+
 def check_git_clean() -> None:
     """Check if git working directory is clean."""
-    result = run_command(["git", "status", "--porcelain"])
-    if result.stdout.strip():
+    repo = open_repo()
+    if repo is not None:
+        # Match `git status --porcelain`: untracked files count, ignored don't
+        dirty = bool(repo.status(untracked_files="normal", ignored=False))
+    else:
+        dirty = bool(run_command(("git", "status", "--porcelain")).stdout.strip())
+    if dirty:
         print("Error: Git working directory is not clean.")
         print("Please commit or stash your changes before releasing.")
         sys.exit(1)
@@ -35,8 +63,12 @@ def check_git_clean() -> None:
 
 def check_git_branch() -> None:
     """Check if we're on the main branch."""
-    result = run_command(["git", "branch", "--show-current"])
-    if result.stdout.strip() != "main":
+    repo = open_repo()
+    if repo is not None:
+        branch = repo.head.shorthand
+    else:
+        branch = run_command(("git", "branch", "--show-current")).stdout.strip()
+    if branch != "main":
         print("Error: Not on main branch.")
         print("Please switch to the main branch before releasing.")
         sys.exit(1)
@@ -44,9 +76,17 @@ def check_git_branch() -> None:
 
 def check_git_remote() -> None:
     """Check if local is up to date with remote."""
-    run_command(["git", "fetch", "origin", "main"])
-    result = run_command(["git", "rev-list", "HEAD..origin/main", "--count"])
-    if int(result.stdout.strip()) != 0:
+    # Fetch with the git CLI so the user's credential setup is used
+    run_command(("git", "fetch", "origin", "main"), capture=False)
+    repo = open_repo()
+    if repo is not None:
+        local = repo.revparse_single("HEAD").id
+        remote = repo.revparse_single("origin/main").id
+        _, behind = repo.ahead_behind(local, remote)
+    else:
+        result = run_command(("git", "rev-list", "HEAD..origin/main", "--count"))
+        behind = int(result.stdout.strip())
+    if behind != 0:
         print("Error: Local branch is behind remote.")
         print("Please pull the latest changes before releasing.")
         sys.exit(1)
@@ -54,10 +94,10 @@ def check_git_remote() -> None:
 
 def check_dependencies() -> None:
     """Check if all required tools are installed."""
-    tools = ["git", "uv", "python"]
+    tools = ("git", "uv", "python")
     for tool in tools:
         try:
-            run_command([tool, "--version"])
+            run_command((tool, "--version"))
         except FileNotFoundError:
             print(f"Error: {tool} is not installed.")
             sys.exit(1)
@@ -99,35 +139,46 @@ def main() -> None:
     # Pre-release checks
     if not args.skip_checks:
         print("Running pre-release checks...")
-        check_dependencies()
-        check_git_clean()
-        check_git_branch()
-        check_git_remote()
+        # The checks are independent and mostly wait on subprocesses, so run
+        # them together; result() re-raises any SystemExit from a failed check
+        checks = (
+            check_dependencies,
+            check_git_clean,
+            check_git_branch,
+            check_git_remote,
+        )
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(check) for check in checks]
+            for future in as_completed(futures):
+                future.result()
         if not args.skip_publish:
             check_pypi_token()
 
     # Step 1: Bump version
     print("Bumping version...")
-    run_command(["make", "version-bump", f"TYPE={args.bump_type}"], cwd=project_root)
+    run_command(
+        ("make", "version-bump", f"TYPE={args.bump_type}"),
+        cwd=project_root,
+        capture=False,
+    )
 
     # Get the new version
-    result = run_command(["make", "version"], cwd=project_root)
-    new_version = result.stdout.strip().split(": ")[1]
+    new_version = read_version(project_root / "pyproject.toml")
 
     # Step 2: Run tests
     if not args.skip_tests:
         print("Running tests...")
-        run_command(["make", "test"], cwd=project_root)
+        run_command(("make", "test"), cwd=project_root, capture=False)
 
     # Step 3: Run linters
     if not args.skip_lint:
         print("Running linters...")
-        run_command(["make", "lint"], cwd=project_root)
+        run_command(("make", "lint"), cwd=project_root, capture=False)
 
     # Step 4: Build the package
     if not args.skip_build:
         print("Building package...")
-        run_command(["make", "build"], cwd=project_root)
+        run_command(("make", "build"), cwd=project_root, capture=False)
 
     # Step 5: Publish to PyPI
     if not args.skip_publish:
@@ -136,15 +187,16 @@ def main() -> None:
             print("Error: PYPI_API_TOKEN environment variable is not set")
             print("Skipping publish step")
         else:
-            run_command(["make", "publish"], cwd=project_root)
+            run_command(("make", "publish"), cwd=project_root, capture=False)
 
     # Step 6: Create git tag
     if not args.skip_tag:
         print("Creating git tag...")
         tag_name = f"v{new_version}"
         run_command(
-            ["git", "tag", "-a", tag_name, "-m", f"Release {tag_name}"],
+            ("git", "tag", "-a", tag_name, "-m", f"Release {tag_name}"),
             cwd=project_root,
+            capture=False,
         )
         print(f"Created tag {tag_name}")
         print(f"Don't forget to push the tag: git push origin {tag_name}")
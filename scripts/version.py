@@ -4,17 +4,35 @@ Version management script for PySumoAPI.
 """
 
 import argparse
+import functools
+import os
 import re
 import sys
 from pathlib import Path
 
+_VERSION_RE = re.compile(r'version\s*=\s*"([^"]+)"')
+_VERSION_SUB_RE = re.compile(r'(version\s*=\s*)"([^"]+)"')
+_CHANGELOG_HEADING = "# Changelog\n\n"
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+
+@functools.lru_cache(maxsize=4)
+def _read_file(file_path: str, mtime: float) -> str:
+    """Read a file, cached per modification time."""
+    with open(file_path) as f:
+        return f.read()
+
+
+def read_file(file_path: str) -> str:
+    """Read a file, reusing the previous read if it hasn't changed since."""
+    return _read_file(str(file_path), os.path.getmtime(file_path))
+
 
 def read_version(file_path: str) -> str:
     """Read version from pyproject.toml."""
-    with open(file_path) as f:
-        content = f.read()
+    content = read_file(file_path)
 
-    match = re.search(r'version\s*=\s*"([^"]+)"', content)
+    match = _VERSION_RE.search(content)
     if not match:
         raise ValueError(f"Could not find version in {file_path}")
 
@@ -23,15 +41,13 @@ def read_version(file_path: str) -> str:
 
 def update_version(file_path: str, new_version: str) -> None:
     """Update version in pyproject.toml."""
-    with open(file_path) as f:
-        content = f.read()
+    content = read_file(file_path)
 
-    updated_content = re.sub(
-        r'(version\s*=\s*)"([^"]+)"', f'\\1"{new_version}"', content
-    )
+    updated_content = _VERSION_SUB_RE.sub(f'\\1"{new_version}"', content)
 
     with open(file_path, "w") as f:
         f.write(updated_content)
+    _read_file.cache_clear()
 
 
 def update_changelog(changelog_path: str, new_version: str) -> None:
@@ -45,16 +61,18 @@ def update_changelog(changelog_path: str, new_version: str) -> None:
         return
 
     # Add new version entry after the first heading
-    updated_content = re.sub(
-        r"(# Changelog\n\n)",
-        f"\\1## [{new_version}] - {get_current_date()}\n\n### Added\n- \n\n",
-        content,
-    )
+    heading = content.find(_CHANGELOG_HEADING)
+    if heading < 0:
+        print("Warning: Could not find '# Changelog' heading in CHANGELOG.md")
+        return
+    insert_at = heading + len(_CHANGELOG_HEADING)
+    entry = f"## [{new_version}] - {get_current_date()}\n\n### Added\n- \n\n"
 
     with open(changelog_path, "w") as f:
-        f.write(updated_content)
+        f.write(content[:insert_at] + entry + content[insert_at:])
 
 
+@functools.cache
 def get_current_date() -> str:
     """Get current date in YYYY-MM-DD format."""
     from datetime import datetime
@@ -114,7 +132,8 @@ def main() -> None:
 
         print(f"Version updated to {new_version}")
         print(
-            f"Don't forget to commit the changes and create a tag: git tag v{new_version}"
+            "Don't forget to commit the changes and create a tag: "
+            f"git tag v{new_version}"
         )
 
     elif args.action == "set":
@@ -122,7 +141,7 @@ def main() -> None:
             parser.error("--version is required for 'set' action")
 
         # Validate version format
-        if not re.match(r"^\d+\.\d+\.\d+$", args.version):
+        if not _SEMVER_RE.match(args.version):
             print("Error: Version must be in the format X.Y.Z")
             sys.exit(1)
 
@@ -133,7 +152,8 @@ def main() -> None:
 
         print(f"Version updated to {args.version}")
         print(
-            f"Don't forget to commit the changes and create a tag: git tag v{args.version}"
+            "Don't forget to commit the changes and create a tag: "
+            f"git tag v{args.version}"
         )
 
 
@@ -1,5 +1,79 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import httpx
 import pytest
+import pytest_asyncio
+
+from pysumoapi.client import SumoClient
 
 pytest_plugins = ["pytest_asyncio"]
 
-# Remove the custom event_loop fixture and use the built-in one from pytest-asyncio 
\ No newline at end of file
+# Tests and async fixtures share one session event loop (see pytest.ini)
+
+
+@pytest.fixture
+def json_response():
+    """Build a real httpx response carrying a JSON body."""
+
+    def _json_response(data, status_code=200, headers=None):
+        return httpx.Response(
+            status_code,
+            json=data,
+            headers=headers,
+            request=httpx.Request("GET", "https://sumo-api.com/api"),
+        )
+
+    return _json_response
+
+
+class MockAPI:
+    """Canned API responses keyed by path, served through httpx.MockTransport."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def add(self, path, payload=None, status_code=200, content=None):
+        """Answer requests for ``path`` (relative to /api).
+
+        The body is ``payload`` encoded as JSON, or ``content`` (bytes or an
+        async iterator of chunks) sent as-is.
+        """
+        self.routes[f"/api{path}"] = (status_code, payload, content)
+
+    def handle(self, request):
+        self.requests.append(request)
+        status_code, payload, content = self.routes.get(
+            request.url.path, (404, {"error": "No mock for this path"}, None)
+        )
+        if content is not None:
+            return httpx.Response(status_code, content=content)
+        return httpx.Response(status_code, json=payload)
+
+
+@pytest.fixture(scope="module")
+def mock_api():
+    """Router for the shared client's transport; tests add the routes they need."""
+    return MockAPI()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def sumo_client(mock_api):
+    """One client shared by a module's tests, so each test skips client setup.
+
+    Its requests go to ``mock_api`` instead of the network, so it skips the
+    TLS context and HTTP/2 setup a real connection would need.
+    """
+    client = SumoClient(enable_http2=False, verify_ssl=False)
+    transport = httpx.MockTransport(mock_api.handle)
+    with patch("httpx.AsyncHTTPTransport", return_value=transport):
+        await client.__aenter__()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(scope="session")
+def future_basho_id():
+    """Basho ID for next month, which the client rejects as a future basho."""
+    return (datetime.now().replace(day=1) + timedelta(days=32)).strftime("%Y%m")
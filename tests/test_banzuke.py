@@ -1,6 +1,5 @@
 """Tests for the banzuke endpoint."""
 
-from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
@@ -10,7 +9,7 @@ from pysumoapi.models import Banzuke, Match, RikishiBanzuke
 
 
 @pytest.mark.asyncio
-async def test_get_banzuke_success():
+async def test_get_banzuke_success(sumo_client):
     """Test successful retrieval of banzuke details."""
     mock_response = {
         "bashoId": "202305",
@@ -41,67 +40,114 @@ async def test_get_banzuke_success():
     }
 
     with patch.object(SumoClient, "_make_request", return_value=mock_response):
-        async with SumoClient() as client:
-            banzuke = await client.get_banzuke("202305", "Makuuchi")
-
-            assert isinstance(banzuke, Banzuke)
-            assert banzuke.basho_id == "202305"
-            assert banzuke.division == "Makuuchi"
-            assert len(banzuke.east) > 0
-
-            # Test first rikishi
-            first_rikishi = banzuke.east[0]
-            assert isinstance(first_rikishi, RikishiBanzuke)
-            assert first_rikishi.rikishi_id == 1
-            assert first_rikishi.shikona_en == "Test Rikishi"
-            if first_rikishi.shikona_jp:
-                assert first_rikishi.shikona_jp == "テスト力士"
-            assert first_rikishi.rank == "Yokozuna"
-            assert first_rikishi.wins == 10
-            assert first_rikishi.losses == 5
-            assert first_rikishi.absences == 0
-            assert len(first_rikishi.record) > 0
-
-            # Test first match
-            first_match = first_rikishi.record[0]
-            assert isinstance(first_match, Match)
-            assert first_match.basho_id == "202305"
-            assert first_match.day > 0
-            assert first_match.result in [
-                "win",
-                "loss",
-                "absent",
-                "fusen loss",
-                "fusen win",
-            ]
-            assert first_match.opponent_id == 2
-            assert first_match.opponent_shikona_en == "Opponent"
-            assert first_match.opponent_shikona_jp == "対戦相手"
-            assert first_match.kimarite == "yorikiri"
+        banzuke = await sumo_client.get_banzuke("202305", "Makuuchi")
 
+        assert isinstance(banzuke, Banzuke)
+        assert banzuke.basho_id == "202305"
+        assert banzuke.division == "Makuuchi"
+        assert len(banzuke.east) > 0
 
-@pytest.mark.asyncio
-async def test_get_banzuke_invalid_id():
-    """Test handling of invalid basho ID format."""
-    async with SumoClient() as client:
-        with pytest.raises(ValueError, match="Basho ID must be in YYYYMM format"):
-            await client.get_banzuke("invalid", "Makuuchi")
+        # Test first rikishi
+        first_rikishi = banzuke.east[0]
+        assert isinstance(first_rikishi, RikishiBanzuke)
+        assert first_rikishi.rikishi_id == 1
+        assert first_rikishi.shikona_en == "Test Rikishi"
+        if first_rikishi.shikona_jp:
+            assert first_rikishi.shikona_jp == "テスト力士"
+        assert first_rikishi.rank == "Yokozuna"
+        assert first_rikishi.wins == 10
+        assert first_rikishi.losses == 5
+        assert first_rikishi.absences == 0
+        assert len(first_rikishi.record) > 0
+
+        # Test first match
+        first_match = first_rikishi.record[0]
+        assert isinstance(first_match, Match)
+        assert first_match.basho_id == "202305"
+        assert first_match.day > 0
+        assert first_match.result in [
+            "win",
+            "loss",
+            "absent",
+            "fusen loss",
+            "fusen win",
+        ]
+        assert first_match.opponent_id == 2
+        assert first_match.opponent_shikona_en == "Opponent"
+        assert first_match.opponent_shikona_jp == "対戦相手"
+        assert first_match.kimarite == "yorikiri"
 
 
 @pytest.mark.asyncio
-async def test_get_banzuke_invalid_division():
-    """Test handling of invalid division."""
-    async with SumoClient() as client:
-        with pytest.raises(ValueError, match="Invalid division"):
-            await client.get_banzuke("202305", "Invalid")
+@pytest.mark.parametrize(
+    "basho_id, division, error",
+    [
+        ("invalid", "Makuuchi", "Basho ID must be in YYYYMM format"),
+        ("202305", "Invalid", "Invalid division"),
+    ],
+)
+async def test_get_banzuke_validation_errors(sumo_client, basho_id, division, error):
+    """Test handling of invalid basho IDs and divisions."""
+    with pytest.raises(ValueError, match=error):
+        await sumo_client.get_banzuke(basho_id, division)
 
 
 @pytest.mark.asyncio
-async def test_get_banzuke_future_date():
+async def test_get_banzuke_future_date(sumo_client, future_basho_id):
     """Test handling of future basho dates."""
-    async with SumoClient() as client:
-        future_date = (datetime.now().replace(day=1) + timedelta(days=32)).strftime(
-            "%Y%m"
+    with pytest.raises(ValueError, match="Cannot fetch future basho"):
+        await sumo_client.get_banzuke(future_basho_id, "Makuuchi")
+
+
+@pytest.mark.asyncio
+async def test_get_banzuke_batch(sumo_client, mock_api):
+    """Test that batch lookups fetch every banzuke and preserve their order."""
+    for basho_id in ("202301", "202303", "202305"):
+        mock_api.add(
+            f"/basho/{basho_id}/banzuke/Makuuchi",
+            {"division": "Makuuchi", "east": [], "west": []},
         )
-        with pytest.raises(ValueError, match="Cannot fetch future basho"):
-            await client.get_banzuke(future_date, "Makuuchi")
+
+    banzukes = await sumo_client.get_banzuke_batch(
+        ["202305", "202301", "202303"], "Makuuchi"
+    )
+
+    assert [banzuke.basho_id for banzuke in banzukes] == [
+        "202305",
+        "202301",
+        "202303",
+    ]
+    assert all(isinstance(banzuke, Banzuke) for banzuke in banzukes)
+
+
+@pytest.mark.asyncio
+async def test_get_banzuke_batch_propagates_errors(sumo_client, mock_api):
+    """Test that an error for one banzuke fails the whole batch."""
+    mock_api.add(
+        "/basho/202305/banzuke/Makuuchi",
+        {"division": "Makuuchi", "east": [], "west": []},
+    )
+    mock_api.add(
+        "/basho/202307/banzuke/Makuuchi",
+        {"error": "Banzuke not found"},
+        status_code=404,
+    )
+
+    with pytest.raises(ValueError, match="API Error: Banzuke not found"):
+        await sumo_client.get_banzuke_batch(["202305", "202307"], "Makuuchi")
+
+
+def test_match_from_banzuke():
+    """Test that Match.from_banzuke fills every field of a banzuke record."""
+    data = {
+        "bashoId": "202305",
+        "result": "win",
+        "opponentID": 41,
+        "opponentShikonaEn": "Terunofuji",
+        "opponentShikonaJp": "照ノ富士",
+        "kimarite": "oshidashi",
+    }
+
+    match = Match.from_banzuke(data)
+
+    assert match.model_dump(by_alias=True, exclude_unset=True) == {**data, "day": 1}
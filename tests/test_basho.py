@@ -1,11 +1,9 @@
 """Tests for the basho endpoint."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from pysumoapi.client import SumoClient
 from pysumoapi.models import Basho, RikishiPrize
 
 # Test constants
@@ -18,7 +16,7 @@ TEST_WAKAMOTOHARU_ID = 13
 
 
 @pytest.mark.asyncio
-async def test_get_basho_success():
+async def test_get_basho_success(sumo_client, mock_api):
     """Test successful retrieval of basho details."""
     basho_id = "202305"
 
@@ -57,15 +55,8 @@ async def test_get_basho_success():
         ],
     }
 
-    async with SumoClient() as client:
-        with patch.object(
-            client._client,
-            "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
-        ):
-            response = await client.get_basho(basho_id)
+    mock_api.add(f"/basho/{basho_id}", mock_response)
+    response = await sumo_client.get_basho(basho_id)
 
     assert isinstance(response, Basho)
     assert response.date == "202305"
@@ -105,17 +96,62 @@ async def test_get_basho_success():
 
 
 @pytest.mark.asyncio
-async def test_get_basho_invalid_id():
-    """Test error handling for invalid basho ID format."""
-    async with SumoClient() as client:
-        with pytest.raises(ValueError):
-            await client.get_basho("invalid")
+@pytest.mark.parametrize(
+    "basho_id, error",
+    [
+        ("invalid", "Basho ID must be in YYYYMM format"),
+        # Non-ASCII digits, bad months and stray characters
+        ("２０２３０５", "Basho ID must be in YYYYMM format"),
+        ("202313", "Basho ID must be in YYYYMM format"),
+        ("202300", "Basho ID must be in YYYYMM format"),
+        ("20230", "Basho ID must be in YYYYMM format"),
+        ("202305\n", "Basho ID must be in YYYYMM format"),
+        ("999901", "Cannot get details for future basho"),
+    ],
+)
+async def test_get_basho_validation_errors(sumo_client, basho_id, error):
+    """Test error handling for malformed and future basho IDs."""
+    with pytest.raises(ValueError, match=error):
+        await sumo_client.get_basho(basho_id)
 
 
 @pytest.mark.asyncio
-async def test_get_basho_future_date():
-    """Test error handling for future basho date."""
-    future_date = "999901"  # Year 9999
-    async with SumoClient() as client:
-        with pytest.raises(ValueError):
-            await client.get_basho(future_date)
+async def test_get_basho_batch(sumo_client, mock_api):
+    """Test that batch lookups fetch every basho and preserve their order."""
+    for basho_id in ("202301", "202303", "202305"):
+        mock_api.add(
+            f"/basho/{basho_id}",
+            {
+                "date": basho_id,
+                "location": "Tokyo, Ryogoku Kokugikan",
+                "startDate": f"{basho_id[:4]}-{basho_id[4:]}-14T00:00:00Z",
+                "endDate": f"{basho_id[:4]}-{basho_id[4:]}-28T00:00:00Z",
+                "yusho": [],
+                "specialPrizes": [],
+            },
+        )
+
+    bashos = await sumo_client.get_basho_batch(["202305", "202301", "202303"])
+
+    assert [basho.date for basho in bashos] == ["202305", "202301", "202303"]
+    assert all(isinstance(basho, Basho) for basho in bashos)
+
+
+@pytest.mark.asyncio
+async def test_get_basho_batch_propagates_errors(sumo_client, mock_api):
+    """Test that an error for one basho fails the whole batch."""
+    mock_api.add(
+        "/basho/202305",
+        {
+            "date": "202305",
+            "location": "Tokyo, Ryogoku Kokugikan",
+            "startDate": "2023-05-14T00:00:00Z",
+            "endDate": "2023-05-28T00:00:00Z",
+            "yusho": [],
+            "specialPrizes": [],
+        },
+    )
+    mock_api.add("/basho/202307", {"error": "Basho not found"}, status_code=404)
+
+    with pytest.raises(ValueError, match="API Error: Basho not found"):
+        await sumo_client.get_basho_batch(["202305", "202307"])
@@ -4,15 +4,23 @@ Tests for the Sumo API client.
 
 import asyncio
 import inspect
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch, MagicMock
 
 import httpx
 import pytest
-from zoneinfo import ZoneInfo
+from pydantic import ValidationError
 
 from pysumoapi.client import SumoClient
-from pysumoapi.models import DivisionStats, Rikishi, RikishiList, RikishiStats, Sansho
+from pysumoapi.models import (
+    DivisionStats,
+    Rank,
+    Rikishi,
+    RikishiList,
+    RikishiStats,
+    Sansho,
+    Shikona,
+)
 
 # Test constants
 TEST_DEFAULT_LIMIT = 10
@@ -47,6 +55,29 @@ TEST_JONIDAN_LOSSES = 5
 TEST_JONOKUCHI_MATCHES = 5
 TEST_JONOKUCHI_WINS = 2
 TEST_JONOKUCHI_LOSSES = 3
+TEST_BIRTH_DATE = datetime(1990, 1, 1, tzinfo=timezone.utc)
+TEST_UPDATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Query strings get_rikishis should send, as they appear on the wire
+EXPECTED_RIKISHIS_PARAMS = {
+    "limit": str(TEST_DEFAULT_LIMIT),
+    "skip": "0",
+    "measurements": "true",
+    "ranks": "true",
+    "shikonas": "true",
+}
+EXPECTED_FILTERED_RIKISHIS_PARAMS = {
+    "limit": str(TEST_CUSTOM_LIMIT),
+    "skip": str(TEST_SKIP),
+    "measurements": "true",
+    "ranks": "true",
+    "shikonas": "true",
+    "shikonaEn": "Test",
+    "heya": "Test Stable",
+    "sumodbId": str(TEST_SUMODB_ID),
+    "nskId": str(TEST_NSK_ID),
+    "intai": "false",
+}
 
 
 @pytest.fixture
@@ -61,7 +92,7 @@ def mock_transport():
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rikishi_response():
     """Create a mock response for the rikishi endpoint."""
     return {
@@ -81,7 +112,7 @@ def mock_rikishi_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rikishi_stats_response():
     """Create a mock response for the rikishi stats endpoint."""
     return {
@@ -147,7 +178,7 @@ def mock_rikishi_stats_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rikishis_response():
     """Create a mock response for the rikishis endpoint."""
     return {
@@ -208,124 +239,37 @@ async def test_sumo_client_default_initialization():
     assert client.enable_http2 is True
     assert client.max_retries == 2
     assert client.retry_backoff_factor == 1.0
+    assert client.max_connections == 100
+    assert client.max_keepalive_connections == 100
+    assert client.keepalive_expiry == 30.0
+    assert client.max_concurrency is None
+    assert client.trust_server is False
 
 
 @pytest.mark.asyncio
-async def test_get_rikishi():
+async def test_get_rikishi(sumo_client, mock_api, mock_rikishi_response):
     """Test getting a single rikishi."""
-    mock_response = {
-        "id": TEST_RIKISHI_ID,
-        "sumodbId": TEST_SUMODB_ID,
-        "nskId": TEST_NSK_ID,
-        "shikonaEn": "Test Rikishi",
-        "shikonaJp": "テスト力士",
-        "currentRank": "M1",
-        "heya": "Test Stable",
-        "birthDate": "1990-01-01T00:00:00Z",
-        "shusshin": "Tokyo",
-        "height": TEST_HEIGHT,
-        "weight": TEST_WEIGHT,
-        "debut": "2010-01",
-        "updatedAt": "2024-01-01T00:00:00Z",
-    }
-
-    async with SumoClient() as client:
-        with patch.object(
-            client._client,
-            "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
-        ):
-            rikishi = await client.get_rikishi("1")
+    mock_api.add("/rikishi/1", mock_rikishi_response)
+    rikishi = await sumo_client.get_rikishi("1")
 
     assert isinstance(rikishi, Rikishi)
     assert rikishi.id == TEST_RIKISHI_ID
     assert rikishi.shikona_en == "Test Rikishi"
     assert rikishi.current_rank == "M1"
     assert rikishi.heya == "Test Stable"
-    assert rikishi.birth_date == datetime(1990, 1, 1, tzinfo=ZoneInfo("UTC"))
+    assert rikishi.birth_date == TEST_BIRTH_DATE
     assert rikishi.shusshin == "Tokyo"
     assert rikishi.height == TEST_HEIGHT
     assert rikishi.weight == TEST_WEIGHT
     assert rikishi.debut == "2010-01"
-    assert rikishi.updated_at == datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))
+    assert rikishi.updated_at == TEST_UPDATED_AT
 
 
 @pytest.mark.asyncio
-async def test_get_rikishi_stats():
+async def test_get_rikishi_stats(sumo_client, mock_api, mock_rikishi_stats_response):
     """Test getting a rikishi's statistics."""
-    mock_response = {
-        "basho": TEST_TOTAL_BASHO,
-        "totalMatches": TEST_TOTAL_MATCHES,
-        "totalWins": TEST_TOTAL_WINS,
-        "totalLosses": TEST_TOTAL_LOSSES,
-        "totalAbsences": TEST_TOTAL_ABSENCES,
-        "yusho": TEST_YUSHO,
-        "absenceByDivision": {
-            "Jonidan": 0,
-            "Jonokuchi": 0,
-            "Juryo": 0,
-            "Makushita": 0,
-            "Makuuchi": TEST_TOTAL_ABSENCES,
-            "Sandanme": 0,
-        },
-        "bashoByDivision": {
-            "Jonidan": 2,
-            "Jonokuchi": 1,
-            "Juryo": 3,
-            "Makushita": 2,
-            "Makuuchi": 2,
-            "Sandanme": 0,
-        },
-        "lossByDivision": {
-            "Jonidan": TEST_JONIDAN_LOSSES,
-            "Jonokuchi": TEST_JONOKUCHI_LOSSES,
-            "Juryo": TEST_JURYO_LOSSES,
-            "Makushita": TEST_MAKUSHITA_LOSSES,
-            "Makuuchi": TEST_MAKUUCHI_LOSSES,
-            "Sandanme": 0,
-        },
-        "totalByDivision": {
-            "Jonidan": TEST_JONIDAN_MATCHES,
-            "Jonokuchi": TEST_JONOKUCHI_MATCHES,
-            "Juryo": TEST_JURYO_MATCHES,
-            "Makushita": TEST_MAKUSHITA_MATCHES,
-            "Makuuchi": TEST_MAKUUCHI_MATCHES,
-            "Sandanme": 0,
-        },
-        "winsByDivision": {
-            "Jonidan": TEST_JONIDAN_WINS,
-            "Jonokuchi": TEST_JONOKUCHI_WINS,
-            "Juryo": TEST_JURYO_WINS,
-            "Makushita": TEST_MAKUSHITA_WINS,
-            "Makuuchi": TEST_MAKUUCHI_WINS,
-            "Sandanme": 0,
-        },
-        "yushoByDivision": {
-            "Jonidan": 0,
-            "Jonokuchi": 0,
-            "Juryo": TEST_YUSHO,
-            "Makushita": 0,
-            "Makuuchi": 0,
-            "Sandanme": 0,
-        },
-        "sansho": {
-            "Gino-sho": TEST_GINO_SHO,
-            "Kanto-sho": TEST_KANTO_SHO,
-            "Shukun-sho": TEST_SHUKUN_SHO,
-        },
-    }
-
-    async with SumoClient() as client:
-        with patch.object(
-            client._client,
-            "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
-        ):
-            stats = await client.get_rikishi_stats("1")
+    mock_api.add("/rikishi/1/stats", mock_rikishi_stats_response)
+    stats = await sumo_client.get_rikishi_stats("1")
 
     assert isinstance(stats, RikishiStats)
     assert stats.basho == TEST_TOTAL_BASHO
@@ -348,40 +292,14 @@ async def test_get_rikishi_stats():
 
 
 @pytest.mark.asyncio
-async def test_get_rikishis():
+async def test_get_rikishis(sumo_client, mock_api, mock_rikishis_response):
     """Test getting a list of rikishi."""
-    mock_response = {
-        "limit": 10,
-        "skip": 0,
-        "total": 1,
-        "records": [
-            {
-                "id": TEST_RIKISHI_ID,
-                "sumodbId": TEST_SUMODB_ID,
-                "nskId": TEST_NSK_ID,
-                "shikonaEn": "Test Rikishi",
-                "shikonaJp": "テスト力士",
-                "currentRank": "M1",
-                "heya": "Test Stable",
-                "birthDate": "1990-01-01T00:00:00Z",
-                "shusshin": "Tokyo",
-                "height": TEST_HEIGHT,
-                "weight": TEST_WEIGHT,
-                "debut": "2010-01",
-                "updatedAt": "2024-01-01T00:00:00Z",
-            }
-        ],
-    }
+    mock_api.add("/rikishis", mock_rikishis_response)
+    result = await sumo_client.get_rikishis()
 
-    async with SumoClient() as client:
-        with patch.object(
-            client._client,
-            "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
-        ):
-            result = await client.get_rikishis()
+    request = mock_api.requests[-1]
+    assert request.method == "GET"
+    assert dict(request.url.params) == EXPECTED_RIKISHIS_PARAMS
 
     assert isinstance(result, RikishiList)
     assert result.limit == TEST_DEFAULT_LIMIT
@@ -395,78 +313,38 @@ async def test_get_rikishis():
     assert rikishi.shikona_en == "Test Rikishi"
     assert rikishi.current_rank == "M1"
     assert rikishi.heya == "Test Stable"
-    assert rikishi.birth_date == datetime(1990, 1, 1, tzinfo=ZoneInfo("UTC"))
+    assert rikishi.birth_date == TEST_BIRTH_DATE
     assert rikishi.shusshin == "Tokyo"
     assert rikishi.height == TEST_HEIGHT
     assert rikishi.weight == TEST_WEIGHT
     assert rikishi.debut == "2010-01"
-    assert rikishi.updated_at == datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))
+    assert rikishi.updated_at == TEST_UPDATED_AT
 
 
 @pytest.mark.asyncio
-async def test_get_rikishis_with_filters():
+async def test_get_rikishis_with_filters(sumo_client, mock_api, mock_rikishis_response):
     """Test getting a list of rikishi with filters."""
-    mock_response = {
-        "limit": 50,
-        "skip": 10,
-        "total": 1,
-        "records": [
-            {
-                "id": TEST_RIKISHI_ID,
-                "sumodbId": TEST_SUMODB_ID,
-                "nskId": TEST_NSK_ID,
-                "shikonaEn": "Test Rikishi",
-                "shikonaJp": "テスト力士",
-                "currentRank": "M1",
-                "heya": "Test Stable",
-                "birthDate": "1990-01-01T00:00:00Z",
-                "shusshin": "Tokyo",
-                "height": TEST_HEIGHT,
-                "weight": TEST_WEIGHT,
-                "debut": "2010-01",
-                "updatedAt": "2024-01-01T00:00:00Z",
-            }
-        ],
-    }
-
-    async with SumoClient() as client:
-        with patch.object(
-            client._client,
-            "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
-        ) as mock_request:
-            result = await client.get_rikishis(
-                shikona_en="Test",
-                heya="Test Stable",
-                sumodb_id=TEST_SUMODB_ID,
-                nsk_id=TEST_NSK_ID,
-                intai=False,
-                measurements=True,
-                ranks=True,
-                shikonas=True,
-                limit=TEST_CUSTOM_LIMIT,
-                skip=TEST_SKIP,
-            )
+    mock_api.add(
+        "/rikishis",
+        {**mock_rikishis_response, "limit": TEST_CUSTOM_LIMIT, "skip": TEST_SKIP},
+    )
+    result = await sumo_client.get_rikishis(
+        shikona_en="Test",
+        heya="Test Stable",
+        sumodb_id=TEST_SUMODB_ID,
+        nsk_id=TEST_NSK_ID,
+        intai=False,
+        measurements=True,
+        ranks=True,
+        shikonas=True,
+        limit=TEST_CUSTOM_LIMIT,
+        skip=TEST_SKIP,
+    )
 
-            # Verify the request parameters
-            mock_request.assert_called_once_with(
-                "GET",
-                "/rikishis",
-                params={
-                    "limit": TEST_CUSTOM_LIMIT,
-                    "skip": TEST_SKIP,
-                    "measurements": "true",
-                    "ranks": "true",
-                    "shikonas": "true",
-                    "shikonaEn": "Test",
-                    "heya": "Test Stable",
-                    "sumodbId": TEST_SUMODB_ID,
-                    "nskId": TEST_NSK_ID,
-                    "intai": "false",
-                },
-            )
+    # Verify the request parameters
+    request = mock_api.requests[-1]
+    assert request.method == "GET"
+    assert dict(request.url.params) == EXPECTED_FILTERED_RIKISHIS_PARAMS
 
     # Verify the response
     assert isinstance(result, RikishiList)
@@ -489,19 +367,17 @@ async def test_ssl_context_error_when_certifi_unavailable():
 
 
 @pytest.mark.asyncio
-async def test_json_decode_error_handling():
+async def test_json_decode_error_handling(sumo_client):
     """Test proper handling of invalid JSON responses."""
-    async with SumoClient() as client:
-        with patch.object(client._client, "request") as mock_request:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.side_effect = ValueError("Invalid JSON")
+    with patch.object(sumo_client._client, "request") as mock_request:
+        mock_request.return_value = httpx.Response(
+            200,
+            content=b"not json",
+            request=httpx.Request("GET", "https://sumo-api.com/api/test"),
+        )
             
-            mock_request.return_value = mock_response
-            
-            with pytest.raises(RuntimeError, match="Invalid JSON from API"):
-                await client._make_request("GET", "/test")
+        with pytest.raises(RuntimeError, match="Invalid JSON from API"):
+            await sumo_client._make_request("GET", "/test")
 
 
 @pytest.mark.asyncio
@@ -522,7 +398,10 @@ async def test_retry_transport_configuration():
                 pass
             
             # Verify transport was created with correct retries
-            mock_transport_class.assert_called_once_with(retries=3)
+            mock_transport_class.assert_called_once()
+            transport_kwargs = mock_transport_class.call_args[1]
+            assert transport_kwargs["retries"] == 3
+            assert transport_kwargs["http2"] is True
             
             # Verify client was created with transport
             mock_client_class.assert_called_once()
@@ -531,21 +410,20 @@ async def test_retry_transport_configuration():
 
 
 @pytest.mark.asyncio
-async def test_404_error_handling():
+async def test_404_error_handling(sumo_client):
     """Test proper handling of 404 errors with error messages."""
-    async with SumoClient() as client:
-        with patch.object(client._client, "request") as mock_request:
-            mock_404_response = MagicMock()
-            mock_404_response.status_code = 404
-            mock_404_response.json.return_value = {"error": "Rikishi not found"}
+    with patch.object(sumo_client._client, "request") as mock_request:
+        mock_404_response = MagicMock()
+        mock_404_response.status_code = 404
+        mock_404_response.json.return_value = {"error": "Rikishi not found"}
             
-            # Mock raise_for_status to not raise since we handle 404s specially
-            mock_404_response.raise_for_status.return_value = None
+        # Mock raise_for_status to not raise since we handle 404s specially
+        mock_404_response.raise_for_status.return_value = None
             
-            mock_request.return_value = mock_404_response
+        mock_request.return_value = mock_404_response
             
-            with pytest.raises(ValueError, match="API Error: Rikishi not found"):
-                await client._make_request("GET", "/test")
+        with pytest.raises(ValueError, match="API Error: Rikishi not found"):
+            await sumo_client._make_request("GET", "/test")
 
 
 @pytest.mark.asyncio
@@ -584,6 +462,96 @@ async def test_timeout_configuration():
             assert timeout.pool == 10.0   # Should use connect timeout
 
 
+@pytest.mark.asyncio
+async def test_connection_pool_limits_configuration():
+    """Test that connection pool limits are applied to the transport."""
+    with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("httpx.AsyncHTTPTransport") as mock_transport_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            client = SumoClient(
+                max_connections=50, max_keepalive_connections=10, keepalive_expiry=60.0
+            )
+
+            async with client:
+                pass
+
+            transport_kwargs = mock_transport_class.call_args[1]
+            limits = transport_kwargs["limits"]
+            assert limits.max_connections == 50
+            assert limits.max_keepalive_connections == 10
+            assert limits.keepalive_expiry == 60.0
+            assert mock_client_class.call_args[1]["limits"] == limits
+
+
+@pytest.mark.asyncio
+async def test_response_cache(tmp_path, mock_rikishi_response, json_response):
+    """Test that GET responses are served from the on-disk cache."""
+    async with SumoClient(cache_dir=tmp_path) as client:
+        with patch.object(client._client, "request") as mock_request:
+            mock_request.return_value = json_response(mock_rikishi_response)
+
+            first = await client.get_rikishi("1")
+            second = await client.get_rikishi("1")
+
+            mock_request.assert_called_once()
+            assert first == second
+            assert len(list(tmp_path.iterdir())) == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_respects_no_store(
+    tmp_path, mock_rikishi_response, json_response
+):
+    """Test that responses marked no-store are not cached."""
+    async with SumoClient(cache_dir=tmp_path) as client:
+        with patch.object(client._client, "request") as mock_request:
+            mock_request.return_value = json_response(
+                mock_rikishi_response, headers={"cache-control": "no-store"}
+            )
+
+            await client.get_rikishi("1")
+            await client.get_rikishi("1")
+
+            assert mock_request.call_count == 2
+            assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skipped_when_unwritable(
+    tmp_path, mock_rikishi_response, json_response
+):
+    """Test that a cache directory that can't be written doesn't fail requests."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    async with SumoClient(cache_dir=blocker / "sub") as client:
+        with patch.object(client._client, "request") as mock_request:
+            mock_request.return_value = json_response(mock_rikishi_response)
+
+            rikishi = await client.get_rikishi("1")
+
+    assert isinstance(rikishi, Rikishi)
+    assert list(tmp_path.iterdir()) == [blocker]
+
+
+@pytest.mark.asyncio
+async def test_memory_cache(mock_rikishi_response, json_response):
+    """Test that GET responses are served from the in-memory LRU cache."""
+    async with SumoClient(cache_size=1) as client:
+        with patch.object(client._client, "request") as mock_request:
+            mock_request.return_value = json_response(mock_rikishi_response)
+
+            await client.get_rikishi("1")
+            await client.get_rikishi("1")
+            assert mock_request.call_count == 1
+
+            # A second key evicts the first
+            await client.get_rikishi("2")
+            await client.get_rikishi("1")
+            assert mock_request.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_ssl_context_with_certifi():
     """Test SSL context creation when certifi is available."""
@@ -604,6 +572,22 @@ async def test_ssl_context_with_certifi():
                 assert mock_ssl_context.call_count >= 1
 
 
+@pytest.mark.asyncio
+async def test_ssl_context_is_shared_between_clients():
+    """Test that the certifi SSL context is built once and reused."""
+    with patch("httpx.AsyncClient", return_value=AsyncMock()):
+        with patch("httpx.AsyncHTTPTransport"):
+            with patch("certifi.where", return_value="/path/to/shared/certs"):
+                with patch("ssl.create_default_context") as mock_ssl_context:
+                    for _ in range(2):
+                        async with SumoClient(verify_ssl=True):
+                            pass
+
+                    mock_ssl_context.assert_called_once_with(
+                        cafile="/path/to/shared/certs"
+                    )
+
+
 @pytest.mark.asyncio
 async def test_ssl_context_without_certifi_and_verify_false():
     """Test SSL context creation when certifi is not available but verify_ssl=False."""
@@ -627,6 +611,190 @@ async def test_ssl_context_without_certifi_and_verify_false():
             assert call_kwargs["verify"] is False
 
 
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_in_flight_requests(
+    mock_rikishi_response, json_response
+):
+    """Test that max_concurrency bounds the number of concurrent requests."""
+    in_flight = 0
+    peak = 0
+
+    async def slow_request(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return json_response(mock_rikishi_response)
+
+    async with SumoClient(max_concurrency=2) as client:
+        with patch.object(client._client, "request", side_effect=slow_request):
+            results = await asyncio.gather(
+                *(client.get_rikishi(str(i)) for i in range(6))
+            )
+
+    assert len(results) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_releases_slot_while_streaming(mock_rikishi_response):
+    """Test that a stream does not hold its request slot while being iterated."""
+    records = [
+        {
+            "id": f"20230{month}-1",
+            "bashoId": f"20230{month}",
+            "rikishiId": 1,
+            "shikonaEn": "Terunofuji",
+            "shikonaJp": "照ノ富士",
+        }
+        for month in (1, 3)
+    ]
+
+    def handler(request):
+        if request.url.path == "/api/shikonas":
+            return httpx.Response(200, json=records)
+        return httpx.Response(200, json=mock_rikishi_response)
+
+    client = SumoClient(max_concurrency=1, enable_http2=False, verify_ssl=False)
+    with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+        await client.__aenter__()
+
+    async def fetch_inside_stream():
+        return [
+            await client.get_rikishi("1")
+            async for _ in client.stream_shikonas(rikishi_id=1)
+        ]
+
+    try:
+        rikishis = await asyncio.wait_for(fetch_inside_stream(), timeout=1)
+    finally:
+        await client.aclose()
+
+    assert len(rikishis) == 2
+    assert all(isinstance(r, Rikishi) for r in rikishis)
+
+
+@pytest.mark.asyncio
+async def test_get_ranks_validates_and_sorts_records(sumo_client, json_response):
+    """Test that history records are validated from the raw body and sorted."""
+    mock_response = [
+        {
+            "id": f"{basho_id}-1",
+            "bashoId": basho_id,
+            "rikishiId": 1,
+            "rankValue": 101,
+            "rank": "Yokozuna 1 East",
+        }
+        for basho_id in ("202303", "202305", "202301")
+    ]
+
+    with patch.object(
+        sumo_client._client, "request", return_value=json_response(mock_response)
+    ):
+        ranks = await sumo_client.get_ranks(rikishi_id=1, sort_order="asc")
+
+    assert [rank.basho_id for rank in ranks] == ["202301", "202303", "202305"]
+    assert all(isinstance(rank, Rank) for rank in ranks)
+
+
+@pytest.mark.asyncio
+async def test_trust_server_builds_records_without_validation(json_response):
+    """Test that trust_server maps aliases and skips validation for records."""
+    # rikishiId is not an int, so validation would reject this record
+    mock_response = [
+        {
+            "id": "202305-1",
+            "bashoId": "202305",
+            "rikishiId": "abc",
+            "shikonaEn": "Hakuho",
+            "shikonaJp": "白鵬",
+        }
+    ]
+
+    async with SumoClient(trust_server=True) as client:
+        with patch.object(
+            client._client, "request", return_value=json_response(mock_response)
+        ):
+            shikonas = await client.get_shikonas(rikishi_id=1)
+
+    assert len(shikonas) == 1
+    assert isinstance(shikonas[0], Shikona)
+    assert shikonas[0].basho_id == "202305"
+    assert shikonas[0].rikishi_id == "abc"
+    assert shikonas[0].shikona_en == "Hakuho"
+
+    async with SumoClient() as client:
+        with patch.object(
+            client._client, "request", return_value=json_response(mock_response)
+        ):
+            with pytest.raises(ValidationError):
+                await client.get_shikonas(rikishi_id=1)
+
+
+@pytest.mark.asyncio
+async def test_get_rikishis_batch(sumo_client, mock_rikishi_response, json_response):
+    """Test that batch lookups fetch every ID and preserve their order."""
+
+    async def request(method, path, params=None):
+        rikishi_id = int(path.rsplit("/", 1)[1])
+        return json_response({**mock_rikishi_response, "id": rikishi_id})
+
+    with patch.object(sumo_client._client, "request", side_effect=request) as mock_request:
+        rikishis = await sumo_client.get_rikishis_batch(["3", "1", "2"])
+
+    assert mock_request.call_count == 3
+    assert [rikishi.id for rikishi in rikishis] == [3, 1, 2]
+    assert all(isinstance(rikishi, Rikishi) for rikishi in rikishis)
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_client():
+    """Test that aclose closes the HTTP client and detaches it."""
+    client = SumoClient()
+    await client.__aenter__()
+    http_client = client._client
+
+    await client.aclose()
+
+    assert http_client.is_closed
+    assert client._client is None
+    with pytest.raises(RuntimeError, match="Client must be used as an async context manager"):
+        await client._make_request("GET", "/test")
+
+
+@pytest.mark.asyncio
+async def test_persistent_client_survives_context_exit():
+    """Test that a persistent client keeps its HTTP client between blocks."""
+    client = SumoClient.persistent()
+
+    async with client:
+        http_client = client._client
+    async with client:
+        assert client._client is http_client
+    assert not http_client.is_closed
+
+    await client.aclose()
+    assert http_client.is_closed
+    assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_nested_context_keeps_client_open():
+    """Test that exiting a nested block does not close the outer block's client."""
+    client = SumoClient()
+
+    async with client:
+        http_client = client._client
+        async with client:
+            assert client._client is http_client
+        assert client._client is http_client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+    assert client._client is None
+
+
 @pytest.mark.asyncio
 async def test_runtime_error_without_context_manager():
     """Test that using client methods without context manager raises RuntimeError."""
@@ -702,7 +870,7 @@ class TestSumoSyncClient:
                 mock_portal_cm_instance.__exit__.assert_called_with(None, None, None)
                 assert client._portal is None # Portal should be reset after exit
 
-    def test_sync_get_rikishi(self, mock_rikishi_response):
+    def test_sync_get_rikishi(self, mock_rikishi_response, json_response):
         """Test a representative API call (get_rikishi) with SumoSyncClient."""
 
         # Mock the blocking portal
@@ -730,10 +898,7 @@ class TestSumoSyncClient:
             with patch("pysumoapi.client.httpx.AsyncClient") as MockAsyncHTTPXClient:
                 mock_httpx_instance = AsyncMock()
                 # Configure the mock_httpx_instance.request to return a mock response
-                mock_http_response = AsyncMock()
-                mock_http_response.json = MagicMock(return_value=mock_rikishi_response)
-                mock_http_response.status_code = 200
-                mock_http_response.raise_for_status = MagicMock() # Ensure it doesn't raise
+                mock_http_response = json_response(mock_rikishi_response)
 
                 mock_httpx_instance.request = AsyncMock(return_value=mock_http_response)
 
@@ -756,7 +921,7 @@ class TestSumoSyncClient:
                     "GET", expected_url, params=None
                 )
 
-    def test_sync_get_rikishis_with_params(self, mock_rikishis_response):
+    def test_sync_get_rikishis_with_params(self, mock_rikishis_response, json_response):
         """Test a sync API call with multiple parameters (get_rikishis)."""
     
         # Mock the blocking portal
@@ -784,10 +949,7 @@ class TestSumoSyncClient:
             with patch("pysumoapi.client.httpx.AsyncClient") as MockAsyncHTTPXClient:
                 mock_httpx_instance = AsyncMock()
                 # Configure the mock_httpx_instance.request to return a mock response
-                mock_http_response = AsyncMock()
-                mock_http_response.json = MagicMock(return_value=mock_rikishis_response)
-                mock_http_response.status_code = 200
-                mock_http_response.raise_for_status = MagicMock() # Ensure it doesn't raise
+                mock_http_response = json_response(mock_rikishis_response)
 
                 mock_httpx_instance.request = AsyncMock(return_value=mock_http_response)
 
@@ -1,6 +1,6 @@
 """Tests for the kimarite matches endpoint."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -14,7 +14,7 @@ TEST_LIMIT = 5
 
 
 @pytest.mark.asyncio
-async def test_get_kimarite_matches_success():
+async def test_get_kimarite_matches_success(json_response):
     """Test successful retrieval of kimarite matches."""
     mock_response = {
         "limit": TEST_LIMIT,
@@ -46,9 +46,7 @@ async def test_get_kimarite_matches_success():
         with patch.object(
             client._client,
             "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
+            return_value=json_response(mock_response),
         ):
             response = await client.get_kimarite_matches(
                 kimarite="yorikiri", sort_order="desc", limit=5
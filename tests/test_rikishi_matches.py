@@ -1,6 +1,6 @@
 """Tests for the rikishi matches endpoint."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -13,7 +13,7 @@ TEST_WEST_ID = 2
 
 
 @pytest.mark.asyncio
-async def test_get_rikishi_matches_success():
+async def test_get_rikishi_matches_success(json_response):
     """Test successful retrieval of rikishi matches."""
     rikishi_id = 1
     basho_id = "202401"
@@ -46,9 +46,7 @@ async def test_get_rikishi_matches_success():
         with patch.object(
             client._client,
             "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
+            return_value=json_response(mock_response),
         ):
             response = await client.get_rikishi_matches(rikishi_id, basho_id)
 
@@ -93,7 +91,7 @@ async def test_get_rikishi_matches_invalid_basho():
 
 
 @pytest.mark.asyncio
-async def test_get_rikishi_matches_no_basho():
+async def test_get_rikishi_matches_no_basho(json_response):
     """Test retrieval of all matches without basho filter."""
     mock_response = {
         "limit": TEST_LIMIT,
@@ -123,9 +121,7 @@ async def test_get_rikishi_matches_no_basho():
         with patch.object(
             client._client,
             "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
+            return_value=json_response(mock_response),
         ):
             response = await client.get_rikishi_matches(1)
 
@@ -1,6 +1,6 @@
 """Tests for the rikishi opponent matches endpoint."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -18,7 +18,7 @@ TEST_WINNER_ID = 45
 
 
 @pytest.mark.asyncio
-async def test_get_rikishi_opponent_matches_success():
+async def test_get_rikishi_opponent_matches_success(json_response):
     """Test successful retrieval of matches between two rikishi."""
     rikishi_id = 1
     opponent_id = 45
@@ -54,9 +54,7 @@ async def test_get_rikishi_opponent_matches_success():
         with patch.object(
             client._client,
             "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
+            return_value=json_response(mock_response),
         ):
             response = await client.get_rikishi_opponent_matches(
                 rikishi_id, opponent_id, basho_id
@@ -113,7 +111,7 @@ async def test_get_rikishi_opponent_matches_invalid_basho():
 
 
 @pytest.mark.asyncio
-async def test_get_rikishi_opponent_matches_no_basho():
+async def test_get_rikishi_opponent_matches_no_basho(json_response):
     """Test retrieval of all matches without basho filter."""
     mock_response = {
         "matches": [
@@ -145,9 +143,7 @@ async def test_get_rikishi_opponent_matches_no_basho():
         with patch.object(
             client._client,
             "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
+            return_value=json_response(mock_response),
         ):
             response = await client.get_rikishi_opponent_matches(1, 45)
 
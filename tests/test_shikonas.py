@@ -1,5 +1,7 @@
 """Tests for the shikonas endpoint."""
 
+import json
+
 import pytest
 
 from pysumoapi.client import SumoClient
@@ -89,3 +91,50 @@ async def test_get_shikonas_no_parameters():
             ValueError, match="Either basho_id or rikishi_id must be provided"
         ):
             await client.get_shikonas()
+
+
+@pytest.mark.asyncio
+async def test_stream_shikonas_chunked_response(sumo_client, mock_api):
+    """Test streaming shikonas from a response split across arbitrary chunks.
+
+    Records are yielded in the order the API sends them, without sorting.
+    """
+    records = [
+        {
+            "id": f"20230{month}-{TEST_RIKISHI_ID}",
+            "bashoId": f"20230{month}",
+            "rikishiId": TEST_RIKISHI_ID,
+            "shikonaEn": "Terunofuji",
+            "shikonaJp": "照ノ富士",
+        }
+        for month in (5, 1, 3)
+    ]
+    body = json.dumps(records, ensure_ascii=False).encode()
+
+    async def chunks():
+        # Small chunks split records and multi-byte characters mid-way
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7]
+
+    mock_api.add("/shikonas", content=chunks())
+    shikonas = [
+        shikona
+        async for shikona in sumo_client.stream_shikonas(rikishi_id=TEST_RIKISHI_ID)
+    ]
+
+    request = mock_api.requests[-1]
+    assert request.url.params["rikishiId"] == str(TEST_RIKISHI_ID)
+    assert "sortOrder" not in request.url.params
+    assert [s.basho_id for s in shikonas] == ["202305", "202301", "202303"]
+    assert all(isinstance(s, Shikona) for s in shikonas)
+    assert shikonas[0].shikona_jp == "照ノ富士"
+
+
+@pytest.mark.asyncio
+async def test_stream_shikonas_api_error(sumo_client, mock_api):
+    """Test that streaming surfaces API error messages."""
+    mock_api.add("/shikonas", {"error": "Rikishi not found"}, status_code=404)
+
+    with pytest.raises(ValueError, match="API Error: Rikishi not found"):
+        async for _ in sumo_client.stream_shikonas(rikishi_id=TEST_RIKISHI_ID):
+            pass
@@ -1,5 +1,5 @@
-from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -8,7 +8,7 @@ from pysumoapi.models import Match, Torikumi, YushoWinner
 
 
 @pytest.mark.asyncio
-async def test_get_torikumi_success():
+async def test_get_torikumi_success(json_response):
     """Test successful retrieval of torikumi details."""
     mock_response = {
         "bashoId": "202305",
@@ -60,9 +60,7 @@ async def test_get_torikumi_success():
         with patch.object(
             client._client,
             "request",
-            return_value=AsyncMock(
-                json=lambda: mock_response, raise_for_status=lambda: None
-            ),
+            return_value=json_response(mock_response),
         ):
             torikumi = await client.get_torikumi("202305", "Makuuchi", 1)
 
@@ -139,11 +137,33 @@ async def test_get_torikumi_invalid_day():
 
 
 @pytest.mark.asyncio
-async def test_get_torikumi_future_date():
+async def test_get_torikumi_future_date(future_basho_id):
     """Test handling of future basho dates."""
     async with SumoClient() as client:
-        future_date = (datetime.now().replace(day=1) + timedelta(days=32)).strftime(
-            "%Y%m"
-        )
         with pytest.raises(ValueError, match="Cannot fetch future basho"):
-            await client.get_torikumi(future_date, "Makuuchi", 1)
+            await client.get_torikumi(future_basho_id, "Makuuchi", 1)
+
+
+def test_match_from_torikumi():
+    """Test that Match.from_torikumi fills every field of a torikumi record."""
+    data = {
+        "id": "202305-1-1-29-41",
+        "bashoId": "202305",
+        "division": "Makuuchi",
+        "day": 1,
+        "matchNo": 1,
+        "eastId": 29,
+        "eastShikona": "Takakeisho",
+        "eastRank": "Ozeki 1 East",
+        "westId": 41,
+        "westShikona": "Terunofuji",
+        "westRank": "Yokozuna 1 East",
+        "kimarite": "oshidashi",
+        "winnerId": 41,
+        "winnerEn": "Terunofuji",
+        "winnerJp": "照ノ富士",
+    }
+
+    match = Match.from_torikumi(data)
+
+    assert match.model_dump(by_alias=True, exclude_unset=True) == data